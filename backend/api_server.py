@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import math
 import os
 import time
 import threading
@@ -26,7 +27,7 @@ from backend.orderbook_metrics import (
     calculate_all_metrics,
 )
 from backend.trade_flow_tracker import Trade, TradeFlowTracker, detect_sweep_direction
-from backend.price_momentum import PriceMomentumTracker
+from backend.price_momentum import PriceMomentumTracker, EMPTY_MOMENTUM
 from backend.market_indicators import ActiveAssetContext, MarketIndicatorsTracker
 from backend.depth_decay import DepthDecayTracker
 from backend.liquidations import LiquidationsDetector
@@ -35,7 +36,7 @@ from backend.volatility import VolatilityTracker
 from backend.session_context import SessionContextTracker
 from backend.candle_fetcher import HyperliquidCandleFetcher
 from backend.regime_detector import RegimeDetector
-from backend.slippage_estimator import SlippageEstimator, OrderBookLevel as SlippageOrderBookLevel
+from backend.slippage_estimator import SlippageEstimator, OrderBookColumns as SlippageBookColumns
 from backend.crowding_detector import CrowdingDetector
 from backend.cross_asset_context import CrossAssetContextTracker
 
@@ -53,6 +54,11 @@ app.add_middleware(
 )
 
 
+def _nan_to_zero(value: float) -> float:
+    """Map NaN to 0.0 for JSON payloads sent to the frontend."""
+    return 0.0 if math.isnan(value) else value
+
+
 class AnalyticsEngine:
     """Analytics engine that processes events and generates data."""
 
@@ -91,6 +97,13 @@ class AnalyticsEngine:
             high_liq_count=10,
         )
         self.slippage_estimator = SlippageEstimator(taker_fee_bps=2.8)
+        # (orderbook, metrics summary) for the current book. OrderBook is
+        # frozen and replaced per snapshot, so polls between book updates
+        # reuse the summary
+        self._orderbook_metrics = None
+        # (orderbook, bid columns, ask columns) for the slippage estimator,
+        # rebuilt only when a new book snapshot arrives
+        self._slippage_columns = None
         self.crowding_detector = CrowdingDetector(
             oi_increasing_threshold=0.5,
             oi_velocity_high_threshold=0.05,
@@ -294,19 +307,20 @@ class AnalyticsEngine:
     def _process_orderbook(self, event) -> None:
         """Process orderbook event."""
         import time
-        timestamp_ms = float(event.time_ms)
+        # Event fields are already numeric (the parser converts them)
+        timestamp_ms = event.time_ms
 
         bid_levels = []
         for bid in event.bids[:20]:
-            price = float(bid.px)
-            size = float(bid.sz)
+            price = bid.px
+            size = bid.sz
             if price > 0 and size > 0:
                 bid_levels.append(OrderBookLevel(price=price, size=size))
 
         ask_levels = []
         for ask in event.asks[:20]:
-            price = float(ask.px)
-            size = float(ask.sz)
+            price = ask.px
+            size = ask.sz
             if price > 0 and size > 0:
                 ask_levels.append(OrderBookLevel(price=price, size=size))
 
@@ -320,7 +334,11 @@ class AnalyticsEngine:
             self.last_orderbook_update_time = time.time()
 
             if self.orderbook.mid_price:
-                self.momentum_tracker.add_price(self.orderbook.mid_price, timestamp_ms)
+                self.momentum_tracker.add_price(
+                    self.orderbook.mid_price,
+                    timestamp_ms,
+                    now_ms=self.last_orderbook_update_time * 1000,
+                )
                 # Update session tracker with current price
                 self.session_tracker.update_price(timestamp_ms, self.orderbook.mid_price)
 
@@ -329,11 +347,11 @@ class AnalyticsEngine:
 
     def _process_trades(self, event) -> None:
         """Process trade event."""
-        price = float(event.px)
-        size = float(event.sz)
+        price = event.px
+        size = event.sz
         # Hyperliquid uses "B" for buy and "A" for sell
         side = "buy" if event.side == "B" else "sell"
-        timestamp_ms = float(event.time_ms)
+        timestamp_ms = event.time_ms
 
         if price > 0 and size > 0:
             trade = Trade(timestamp_ms=timestamp_ms, price=price, size=size, side=side)
@@ -393,16 +411,19 @@ class AnalyticsEngine:
         context = ActiveAssetContext(
             timestamp_ms=timestamp_ms,
             coin=event.coin,
-            open_interest_usd=float(event.open_interest),
-            funding_rate=float(event.funding),
-            mark_price=float(event.mark_px),
-            oracle_price=float(event.oracle_px) if event.oracle_px is not None else None,
+            open_interest_usd=event.open_interest,
+            funding_rate=event.funding,
+            mark_price=event.mark_px,
+            oracle_price=event.oracle_px,
         )
 
         self.market_tracker.add_context(context)
 
     def get_analytics_data(self) -> Dict[str, Any]:
         """Get current analytics data as JSON."""
+        # One clock read shared by the time-windowed trackers below
+        now_ms = time.time() * 1000
+
         # Fetch Hyperliquid volumes periodically (rate-limited to once per 60s)
         if self.coin:
             self.fetch_hyperliquid_volumes(self.coin)
@@ -423,10 +444,19 @@ class AnalyticsEngine:
         # Orderbook metrics
         if self.orderbook:
             try:
-                metrics = calculate_all_metrics(self.orderbook)
-                l2_bid, l2_ask = self.orderbook.l2_depth_usd()
-                l3_bid, l3_ask = self.orderbook.l3_depth_usd()
-                l4_bid, l4_ask = self.orderbook.l4_depth_usd()
+                cached_metrics = self._orderbook_metrics
+                if cached_metrics is not None and cached_metrics[0] is self.orderbook:
+                    metrics = cached_metrics[1]
+                else:
+                    # No trade sizes: metrics.liquidity_by_size is deliberately
+                    # empty. Size-based execution costs for the payload come
+                    # from the slippage estimator below, so don't read it here.
+                    metrics = calculate_all_metrics(self.orderbook, trade_sizes_usd=[])
+                    self._orderbook_metrics = (self.orderbook, metrics)
+                depths = self.orderbook.depths_l1_to_l5()
+                l2_bid, l2_ask = depths[1]
+                l3_bid, l3_ask = depths[2]
+                l4_bid, l4_ask = depths[3]
 
                 # Build orderbook ladder (top 10 levels each side)
                 bids_ladder = []
@@ -489,15 +519,15 @@ class AnalyticsEngine:
 
         # Momentum
         try:
-            short, long = self.momentum_tracker.get_all_momentum()
+            short, long = self.momentum_tracker.get_all_momentum(now_ms)
             data["momentum"] = {}
-            if short:
+            if short is not EMPTY_MOMENTUM:
                 data["momentum"]["short"] = {
                     "direction": short.direction,
                     "change_percent": short.change_percent,
                     "is_usable": short.is_usable,
                 }
-            if long:
+            if long is not EMPTY_MOMENTUM:
                 data["momentum"]["long"] = {
                     "direction": long.direction,
                     "change_percent": long.change_percent,
@@ -645,7 +675,7 @@ class AnalyticsEngine:
 
         # Session/Daily Context
         try:
-            session_ctx = self.session_tracker.get_context()
+            session_ctx = self.session_tracker.get_context(now_ms)
             if session_ctx:
                 data["session_context"] = {
                     "daily_high": session_ctx.daily_high,
@@ -720,23 +750,21 @@ class AnalyticsEngine:
         # Slippage estimates
         try:
             if self.orderbook and self.orderbook.bids and self.orderbook.asks:
-                # Convert orderbook levels to slippage estimator format
-                bids = [
-                    SlippageOrderBookLevel(
-                        price=level.price,
-                        size=level.size,
-                        total_usd=level.notional_usd
+                # Fill slippage estimator columns straight from the book levels,
+                # once per book so the estimator can reuse its results
+                cached_columns = self._slippage_columns
+                if cached_columns is not None and cached_columns[0] is self.orderbook:
+                    _, bids, asks = cached_columns
+                else:
+                    bids = SlippageBookColumns.from_pairs(
+                        (level.price, level.notional_usd)
+                        for level in self.orderbook.bids.levels[:20]  # Use top 20 levels
                     )
-                    for level in self.orderbook.bids.levels[:20]  # Use top 20 levels
-                ]
-                asks = [
-                    SlippageOrderBookLevel(
-                        price=level.price,
-                        size=level.size,
-                        total_usd=level.notional_usd
+                    asks = SlippageBookColumns.from_pairs(
+                        (level.price, level.notional_usd)
+                        for level in self.orderbook.asks.levels[:20]  # Use top 20 levels
                     )
-                    for level in self.orderbook.asks.levels[:20]  # Use top 20 levels
-                ]
+                    self._slippage_columns = (self.orderbook, bids, asks)
 
                 # Standard trade sizes
                 trade_sizes = [500.0, 1000.0, 5000.0]
@@ -884,12 +912,13 @@ class AnalyticsEngine:
             for symbol, ctx in all_context.items():
                 cross_asset_data[symbol] = {
                     "current_price": ctx.current_price,
-                    "return_1m": ctx.return_1m,
-                    "return_5m": ctx.return_5m,
-                    "return_15m": ctx.return_15m,
-                    "return_1h": ctx.return_1h,
-                    "volatility_regime": ctx.volatility_regime,
-                    "trend_regime": ctx.trend_regime,
+                    # NaN (insufficient history) is not valid JSON; send 0.0
+                    "return_1m": _nan_to_zero(ctx.return_1m),
+                    "return_5m": _nan_to_zero(ctx.return_5m),
+                    "return_15m": _nan_to_zero(ctx.return_15m),
+                    "return_1h": _nan_to_zero(ctx.return_1h),
+                    "volatility_regime": ctx.volatility_regime.label,
+                    "trend_regime": ctx.trend_regime.label,
                     "volume_24h": ctx.volume_24h,
                 }
 
@@ -8,7 +8,8 @@ connect to and which public feeds to subscribe to for a single perp coin.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 
 @dataclass(frozen=True)
@@ -43,7 +44,7 @@ TESTNET = NetworkConfig(
 )
 
 
-@dataclass
+@dataclass(frozen=True)
 class SubscriptionConfig:
     """Configuration for public market-data subscriptions for a single coin.
 
@@ -84,7 +85,7 @@ class SubscriptionConfig:
         return subs
 
 
-@dataclass
+@dataclass(frozen=True)
 class HyperliquidClientConfig:
     """Configuration for :class:`backend.hyperliquid_client.HyperliquidClient`.
 
@@ -117,7 +118,23 @@ class HyperliquidClientConfig:
         subscription_overrides:
             Optional keyword arguments forwarded to :class:`SubscriptionConfig`
             to tweak which streams are enabled.
+
+        Configs are immutable, so identical requests (for example on
+        reconnect) share a single cached instance.
         """
 
-        subscription = SubscriptionConfig(coin=coin, **subscription_overrides)
-        return cls(network=network, subscription=subscription)
+        overrides = tuple(sorted(subscription_overrides.items()))
+        return _build_client_config(cls, coin, network, overrides)
+
+
+@lru_cache(maxsize=256)
+def _build_client_config(
+    cls: type,
+    coin: str,
+    network: NetworkConfig,
+    overrides: Tuple[Tuple[str, object], ...],
+) -> HyperliquidClientConfig:
+    """Build (and memoize) a config for :meth:`HyperliquidClientConfig.for_coin`."""
+
+    subscription = SubscriptionConfig(coin=coin, **dict(overrides))
+    return cls(network=network, subscription=subscription)
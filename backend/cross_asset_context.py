@@ -6,33 +6,60 @@ for major crypto assets to provide broader market context.
 
 from __future__ import annotations
 
+import math
 import time
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import Optional, Dict, Any
 from collections import deque
 
 import requests
 
+from .models import Trend
+
+
+class VolatilityRegime(IntEnum):
+    """Volatility classification from 1h return magnitude."""
+
+    LOW = 0
+    NORMAL = 1
+    HIGH = 2
+    UNKNOWN = 3
+
+    @property
+    def label(self) -> str:
+        """Lowercase name used at the formatting/serialization boundary."""
+        return _VOLATILITY_LABELS[self]
+
+
+_VOLATILITY_LABELS = {member: member.name.lower() for member in VolatilityRegime}
+
+# Return lookbacks in seconds: 1m, 5m, 15m, 1h
+RETURN_LOOKBACKS_SECONDS = (60, 300, 900, 3600)
+
 
 @dataclass
 class AssetSnapshot:
     """Snapshot of asset price and metrics at a point in time."""
-    timestamp_ms: float
+    timestamp_ms: int
     price: float
     volume_24h: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AssetContext:
-    """Context metrics for a single asset."""
+    """Context metrics for a single asset.
+
+    Returns are percentages; NaN means not enough history for that lookback.
+    """
     symbol: str
     current_price: float
     return_1m: float
     return_5m: float
     return_15m: float
     return_1h: float
-    volatility_regime: str  # 'low', 'normal', 'high'
-    trend_regime: str  # 'up', 'down', 'range'
+    volatility_regime: VolatilityRegime  # LOW, NORMAL, HIGH
+    trend_regime: Trend  # UP, DOWN, RANGE
     volume_24h: Optional[float] = None
 
 
@@ -65,16 +92,31 @@ class CrossAssetContextTracker:
             for asset in self.assets
         }
 
-        # Last fetch time to avoid hammering the API
-        self.last_fetch_time = 0.0
+        # Total snapshots ever appended per asset; with the deque length this
+        # gives the sequence number of the oldest retained snapshot
+        self._append_counts: Dict[str, int] = {asset: 0 for asset in self.assets}
+
+        # Per-asset sequence number of the first snapshot inside each return
+        # lookback window (same order as RETURN_LOOKBACKS_SECONDS). Cutoffs
+        # only move forward, so these cursors only ever advance.
+        self._return_cursors: Dict[str, list[int]] = {
+            asset: [0] * len(RETURN_LOOKBACKS_SECONDS)
+            for asset in self.assets
+        }
+
+        # Last fetch time (monotonic clock) to avoid hammering the API
+        self._last_fetch_mono: Optional[float] = None
         self.fetch_interval_seconds = 1.0  # Fetch every 1 second
 
     def fetch_and_update(self) -> None:
         """Fetch latest prices from Hyperliquid API and update history."""
-        current_time = time.time()
+        now_mono = time.monotonic()
 
-        # Rate limit
-        if current_time - self.last_fetch_time < self.fetch_interval_seconds:
+        # Rate limit (monotonic so wall-clock jumps can't stall or spam fetches)
+        if (
+            self._last_fetch_mono is not None
+            and now_mono - self._last_fetch_mono < self.fetch_interval_seconds
+        ):
             return
 
         try:
@@ -87,6 +129,8 @@ class CrossAssetContextTracker:
             response.raise_for_status()
             data = response.json()
 
+            ts_ms = time.time_ns() // 1_000_000
+
             if isinstance(data, list) and len(data) == 2:
                 universe = data[0]  # Meta
                 contexts = data[1]  # Asset contexts
@@ -110,90 +154,102 @@ class CrossAssetContextTracker:
                             volume_24h = float(day_volume) if day_volume else None
 
                             snapshot = AssetSnapshot(
-                                timestamp_ms=current_time * 1000,
+                                timestamp_ms=ts_ms,
                                 price=price,
                                 volume_24h=volume_24h
                             )
 
                             self.price_history[asset].append(snapshot)
+                            self._append_counts[asset] += 1
 
-            self.last_fetch_time = current_time
+            self._last_fetch_mono = now_mono
 
         except Exception as e:
             print(f"[ERROR] Failed to fetch cross-asset data: {e}")
 
-    def _calculate_return(
+    def _calculate_returns(
         self,
         asset: str,
-        lookback_seconds: float
-    ) -> Optional[float]:
-        """Calculate return over a lookback period.
+    ) -> tuple[float, ...]:
+        """Calculate returns for every lookback in ``RETURN_LOOKBACKS_SECONDS``.
+
+        Each lookback keeps a cursor into the history that is advanced past
+        snapshots older than its cutoff, so lookups are amortized O(1)
+        instead of rescanning the deque from the oldest snapshot.
 
         Returns:
-            Return as percentage, or None if insufficient data
+            Tuple of returns as percentages (same order as
+            ``RETURN_LOOKBACKS_SECONDS``), NaN where history is insufficient
         """
         history = self.price_history.get(asset)
         if not history or len(history) < 2:
-            return None
+            return (math.nan,) * len(RETURN_LOOKBACKS_SECONDS)
+
+        current_time = time.time_ns() // 1_000_000
 
-        current_time = time.time() * 1000
-        cutoff_time = current_time - (lookback_seconds * 1000)
+        # Sequence number of history[0]; snapshots before it were evicted
+        n = len(history)
+        head_seq = max(self._append_counts[asset] - n, 0)
+        cursors = self._return_cursors[asset]
 
         # Get current price (most recent)
-        current_snapshot = history[-1]
+        current_price = history[-1].price
 
-        # Find snapshot closest to lookback time
-        lookback_snapshot = None
-        for snapshot in history:
-            if snapshot.timestamp_ms >= cutoff_time:
-                lookback_snapshot = snapshot
-                break
+        returns: list[float] = []
+        for i, lookback in enumerate(RETURN_LOOKBACKS_SECONDS):
+            cutoff_time = current_time - lookback * 1000
 
-        if lookback_snapshot is None:
-            # Not enough history
-            return None
+            # Find first snapshot at or after the cutoff, resuming from cursor
+            idx = max(cursors[i] - head_seq, 0)
+            while idx < n and history[idx].timestamp_ms < cutoff_time:
+                idx += 1
+            cursors[i] = head_seq + idx
+
+            if idx == n:
+                # Not enough history
+                returns.append(math.nan)
+                continue
 
-        # Calculate return
-        price_change = current_snapshot.price - lookback_snapshot.price
-        return_pct = (price_change / lookback_snapshot.price) * 100
+            lookback_price = history[idx].price
+            returns.append((current_price - lookback_price) / lookback_price * 100)
 
-        return return_pct
+        return tuple(returns)
 
-    def _determine_volatility_regime(self, return_1h: Optional[float]) -> str:
+    def _determine_volatility_regime(self, return_1h: float) -> VolatilityRegime:
         """Determine volatility regime based on 1h return magnitude."""
-        if return_1h is None:
-            return "unknown"
+        if math.isnan(return_1h):
+            return VolatilityRegime.UNKNOWN
 
         abs_return = abs(return_1h)
 
         if abs_return < self.low_vol_threshold:
-            return "low"
+            return VolatilityRegime.LOW
         elif abs_return > self.high_vol_threshold:
-            return "high"
+            return VolatilityRegime.HIGH
         else:
-            return "normal"
+            return VolatilityRegime.NORMAL
 
     def _determine_trend_regime(
         self,
-        return_1m: Optional[float],
-        return_5m: Optional[float],
-        return_15m: Optional[float]
-    ) -> str:
+        return_1m: float,
+        return_5m: float,
+        return_15m: float
+    ) -> Trend:
         """Determine trend regime based on multi-timeframe returns."""
-        if return_15m is None:
-            return "unknown"
+        if math.isnan(return_15m):
+            return Trend.UNKNOWN
 
         # Use 15m as primary signal
         if return_15m > self.trend_threshold:
-            # Confirm with 5m
-            if return_5m and return_5m > 0:
-                return "up"
+            # Confirm with 5m (NaN compares False)
+            if return_5m > 0:
+                return Trend.UP
         elif return_15m < -self.trend_threshold:
-            # Confirm with 5m
-            if return_5m and return_5m < 0:
-                return "down"
+            # Confirm with 5m (NaN compares False)
+            if return_5m < 0:
+                return Trend.DOWN
 
-        return "range"
+        return Trend.RANGE
 
     def get_context(self, asset: str) -> Optional[AssetContext]:
         """Get current context for a specific asset.
@@ -213,11 +269,8 @@ class CrossAssetContextTracker:
         current_price = latest.price
         volume_24h = latest.volume_24h
 
-        # Calculate returns across timeframes
-        return_1m = self._calculate_return(asset, 60)  # 1 minute
-        return_5m = self._calculate_return(asset, 300)  # 5 minutes
-        return_15m = self._calculate_return(asset, 900)  # 15 minutes
-        return_1h = self._calculate_return(asset, 3600)  # 1 hour
+        # Calculate returns across timeframes (1m, 5m, 15m, 1h)
+        return_1m, return_5m, return_15m, return_1h = self._calculate_returns(asset)
 
         # Determine regimes
         vol_regime = self._determine_volatility_regime(return_1h)
@@ -226,10 +279,10 @@ class CrossAssetContextTracker:
         return AssetContext(
             symbol=asset,
             current_price=current_price,
-            return_1m=return_1m if return_1m is not None else 0.0,
-            return_5m=return_5m if return_5m is not None else 0.0,
-            return_15m=return_15m if return_15m is not None else 0.0,
-            return_1h=return_1h if return_1h is not None else 0.0,
+            return_1m=return_1m,
+            return_5m=return_5m,
+            return_15m=return_15m,
+            return_1h=return_1h,
             volatility_regime=vol_regime,
             trend_regime=trend_regime,
             volume_24h=volume_24h,
@@ -261,11 +314,14 @@ class CrossAssetContextTracker:
             return "unknown"
 
         # Check if both are trending in same direction
-        if btc_ctx.trend_regime == "up" and eth_ctx.trend_regime == "up":
+        btc_trend = btc_ctx.trend_regime
+        if btc_trend is not eth_ctx.trend_regime:
+            return "mixed"
+        if btc_trend is Trend.UP:
             return "bullish"
-        elif btc_ctx.trend_regime == "down" and eth_ctx.trend_regime == "down":
+        elif btc_trend is Trend.DOWN:
             return "bearish"
-        elif btc_ctx.trend_regime == "range" and eth_ctx.trend_regime == "range":
+        elif btc_trend is Trend.RANGE:
             return "neutral"
         else:
             return "mixed"
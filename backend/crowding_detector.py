@@ -13,11 +13,71 @@ Crowded positions can lead to:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Optional, Union
 
+from .models import Trend
 
-@dataclass
+
+class BasisStatus(IntEnum):
+    """Perp-spot basis classification."""
+
+    RICH = 0
+    FAIR = 1
+    CHEAP = 2
+    UNKNOWN = 3
+
+    @property
+    def label(self) -> str:
+        """Display name used at the formatting/serialization boundary.
+
+        Matches the status strings produced by MarketIndicatorsTracker
+        ("Premium", "Normal", "Discount").
+        """
+        return _BASIS_LABELS[self]
+
+    @classmethod
+    def parse(cls, value: Union["BasisStatus", str]) -> "BasisStatus":
+        """Coerce a basis string ("rich", "Premium", "fair", ...) to a member."""
+        if isinstance(value, BasisStatus):
+            return value
+        return _BASIS_ALIASES.get(value, cls.UNKNOWN)
+
+
+_BASIS_LABELS = {
+    BasisStatus.RICH: "Premium",
+    BasisStatus.FAIR: "Normal",
+    BasisStatus.CHEAP: "Discount",
+    BasisStatus.UNKNOWN: "unknown",
+}
+_BASIS_ALIASES = {
+    "rich": BasisStatus.RICH,
+    "Premium": BasisStatus.RICH,
+    "fair": BasisStatus.FAIR,
+    "Normal": BasisStatus.FAIR,
+    "cheap": BasisStatus.CHEAP,
+    "Discount": BasisStatus.CHEAP,
+}
+
+# Interpretation templates, filled in only when the text is actually read
+_MIXED_TEXT = "Mixed signals: both longs and shorts show crowding indicators"
+_CROWDED_LONG_TEMPLATE = (
+    "Crowded LONG (score: {score:.2f}): "
+    "High OI {oi_trend}, positive funding, perp {basis_status}. "
+    "Risk of long liquidations if price drops."
+)
+_CROWDED_SHORT_TEMPLATE = (
+    "Crowded SHORT (score: {score:.2f}): "
+    "High OI {oi_trend}, negative funding, perp {basis_status}. "
+    "Risk of short squeeze if price rises."
+)
+_LEAN_LONG_TEMPLATE = "Lean long (score: {score:.2f}) but not crowded"
+_LEAN_SHORT_TEMPLATE = "Lean short (score: {score:.2f}) but not crowded"
+_BALANCED_TEXT = "Balanced positioning, no crowding detected"
+
+
+@dataclass(slots=True)
 class CrowdingFlags:
     """Position crowding flags."""
 
@@ -30,15 +90,51 @@ class CrowdingFlags:
     short_crowding_score: float
 
     # Supporting metrics
-    oi_trend: str  # "up", "down", "flat"
+    oi_trend: Trend  # UP, DOWN, FLAT
     oi_velocity: float  # % per minute
     funding_rate: float  # %
-    funding_trend: str  # "rising", "falling", "stable"
+    funding_trend: Trend  # UP, DOWN, FLAT
     basis_percent: float  # %
-    basis_status: str  # "rich", "fair", "cheap"
+    basis_status: BasisStatus  # RICH, FAIR, CHEAP
+
+    # Interpretation (built lazily on first access)
+    _interpretation: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def interpretation(self) -> str:
+        """Human-readable interpretation of the crowding state."""
+        if self._interpretation is None:
+            self._interpretation = self._generate_interpretation()
+        return self._interpretation
 
-    # Interpretation
-    interpretation: str
+    def _generate_interpretation(self) -> str:
+        """Generate human-readable interpretation."""
+        if self.crowded_long and self.crowded_short:
+            return _MIXED_TEXT
+
+        if self.crowded_long:
+            return _CROWDED_LONG_TEMPLATE.format(
+                score=self.long_crowding_score,
+                oi_trend=self.oi_trend.label,
+                basis_status=self.basis_status.label,
+            )
+
+        if self.crowded_short:
+            return _CROWDED_SHORT_TEMPLATE.format(
+                score=self.short_crowding_score,
+                oi_trend=self.oi_trend.label,
+                basis_status=self.basis_status.label,
+            )
+
+        # Not crowded
+        if self.long_crowding_score > self.short_crowding_score:
+            return _LEAN_LONG_TEMPLATE.format(score=self.long_crowding_score)
+        elif self.short_crowding_score > self.long_crowding_score:
+            return _LEAN_SHORT_TEMPLATE.format(score=self.short_crowding_score)
+        else:
+            return _BALANCED_TEXT
 
 
 class CrowdingDetector:
@@ -75,40 +171,45 @@ class CrowdingDetector:
 
     def detect(
         self,
-        oi_trend: str,
+        oi_trend: Union[Trend, str],
         oi_velocity: float,
         funding_rate: float,
-        funding_trend: str,
+        funding_trend: Union[Trend, str],
         basis_percent: float,
-        basis_status: str,
+        basis_status: Union[BasisStatus, str],
     ) -> CrowdingFlags:
         """Detect position crowding.
 
         Parameters
         ----------
-        oi_trend : str
-            OI trend ("up", "down", "flat")
+        oi_trend : Trend or str
+            OI trend (``Trend`` member or "up", "down", "flat")
         oi_velocity : float
             OI velocity in % per minute
         funding_rate : float
             Current funding rate (%)
-        funding_trend : str
-            Funding trend ("rising", "falling", "stable")
+        funding_trend : Trend or str
+            Funding trend (``Trend`` member or "rising", "falling", "stable")
         basis_percent : float
             Perp-spot basis (%)
-        basis_status : str
-            Basis status ("rich", "fair", "cheap")
+        basis_status : BasisStatus or str
+            Basis status (``BasisStatus`` member or "Premium", "Normal",
+            "Discount"; "rich", "fair", "cheap" are also accepted)
 
         Returns
         -------
         CrowdingFlags
             Crowding detection result
         """
+        oi_trend = Trend.parse(oi_trend)
+        funding_trend = Trend.parse(funding_trend)
+        basis_status = BasisStatus.parse(basis_status)
+
         # Calculate long crowding score
         long_score = 0.0
 
         # OI increasing = more positions opened
-        if oi_trend == "up":
+        if oi_trend is Trend.UP:
             long_score += 0.3
 
         # High OI velocity = rapid position accumulation
@@ -129,7 +230,7 @@ class CrowdingDetector:
         short_score = 0.0
 
         # OI increasing = more positions opened
-        if oi_trend == "up":
+        if oi_trend is Trend.UP:
             short_score += 0.3
 
         # High OI velocity = rapid position accumulation
@@ -150,13 +251,6 @@ class CrowdingDetector:
         crowded_long = long_score >= self.crowding_threshold
         crowded_short = short_score >= self.crowding_threshold
 
-        # Generate interpretation
-        interpretation = self._generate_interpretation(
-            crowded_long, crowded_short,
-            long_score, short_score,
-            oi_trend, funding_rate, basis_status
-        )
-
         return CrowdingFlags(
             crowded_long=crowded_long,
             crowded_short=crowded_short,
@@ -168,45 +262,8 @@ class CrowdingDetector:
             funding_trend=funding_trend,
             basis_percent=basis_percent,
             basis_status=basis_status,
-            interpretation=interpretation,
         )
 
-    def _generate_interpretation(
-        self,
-        crowded_long: bool,
-        crowded_short: bool,
-        long_score: float,
-        short_score: float,
-        oi_trend: str,
-        funding_rate: float,
-        basis_status: str,
-    ) -> str:
-        """Generate human-readable interpretation."""
-        if crowded_long and crowded_short:
-            return "Mixed signals: both longs and shorts show crowding indicators"
-
-        if crowded_long:
-            return (
-                f"Crowded LONG (score: {long_score:.2f}): "
-                f"High OI {oi_trend}, positive funding, perp {basis_status}. "
-                "Risk of long liquidations if price drops."
-            )
-
-        if crowded_short:
-            return (
-                f"Crowded SHORT (score: {short_score:.2f}): "
-                f"High OI {oi_trend}, negative funding, perp {basis_status}. "
-                "Risk of short squeeze if price rises."
-            )
-
-        # Not crowded
-        if long_score > short_score:
-            return f"Lean long (score: {long_score:.2f}) but not crowded"
-        elif short_score > long_score:
-            return f"Lean short (score: {short_score:.2f}) but not crowded"
-        else:
-            return "Balanced positioning, no crowding detected"
-
 
 def format_crowding_summary(crowding: CrowdingFlags) -> str:
     """Format crowding flags as readable summary.
@@ -231,12 +288,12 @@ def format_crowding_summary(crowding: CrowdingFlags) -> str:
                 f"(score: {crowding.short_crowding_score:.2f})")
 
     lines.append(f"\nSupporting Metrics:")
-    lines.append(f"  OI Trend:       {crowding.oi_trend.upper()}  "
+    lines.append(f"  OI Trend:       {crowding.oi_trend.label.upper()}  "
                 f"(velocity: {crowding.oi_velocity:+.3f}% per min)")
     lines.append(f"  Funding Rate:   {crowding.funding_rate:+.4f}%  "
-                f"({crowding.funding_trend})")
+                f"({crowding.funding_trend.label})")
     lines.append(f"  Basis:          {crowding.basis_percent:+.3f}%  "
-                f"({crowding.basis_status})")
+                f"({crowding.basis_status.label})")
 
     lines.append(f"\nInterpretation:")
     lines.append(f"  {crowding.interpretation}")
@@ -18,8 +18,20 @@ using synthetic messages that mirror the Hyperliquid WebSocket payloads
 
 from __future__ import annotations
 
-from collections import deque
-from typing import Any, Deque, Iterable, Iterator, List, Mapping, Optional, Protocol
+import sys
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Sequence,
+    Union,
+)
 
 from .config import HyperliquidClientConfig, SubscriptionConfig, MAINNET
 from .models import (
@@ -32,6 +44,9 @@ from .models import (
     TradeEvent,
 )
 
+# Raw book level shapes: {"px", "sz", "n"} objects or compact [px, sz, n]
+_LEVEL_TYPES = (Mapping, list, tuple)
+
 
 class HyperliquidTransport(Protocol):
     """Protocol for a transport that yields raw WebSocket-like messages.
@@ -80,7 +95,8 @@ class HyperliquidMessageParser:
     """
 
     def __init__(self, *, coin: Optional[str] = None) -> None:
-        self._coin = coin
+        # Interned so matches usually short-circuit on identity
+        self._coin = sys.intern(coin) if coin is not None else None
 
     @property
     def coin(self) -> Optional[str]:
@@ -95,39 +111,73 @@ class HyperliquidMessageParser:
         it pertains to a different coin than the parser is configured for.
         """
 
-        channel = message.get("channel")
         data = message.get("data")
+        if data is None:
+            return []
 
-        if channel is None or data is None:
+        handler = self._DISPATCH.get(message.get("channel"))
+        if handler is None:
+            # Unknown channel
             return []
+        return handler(self, data)
 
-        if channel == "l2Book" and isinstance(data, Mapping):
-            book = self._parse_l2_book(data)
-            return [book] if book is not None else []
+    # ------------------------------------------------------------------
+    # Channel handlers (shape check + list wrapping)
+    # ------------------------------------------------------------------
 
-        if channel == "bbo" and isinstance(data, Mapping):
-            bbo = self._parse_bbo(data)
-            return [bbo] if bbo is not None else []
+    def _handle_l2_book(self, data: Any) -> List[MarketEvent]:
+        if not isinstance(data, Mapping):
+            return []
+        book = self._parse_l2_book(data)
+        return [book] if book is not None else []
 
-        if channel == "trades" and isinstance(data, list):
-            return self._parse_trades(data)
+    def _handle_bbo(self, data: Any) -> List[MarketEvent]:
+        if not isinstance(data, Mapping):
+            return []
+        bbo = self._parse_bbo(data)
+        return [bbo] if bbo is not None else []
 
-        if channel == "candle" and isinstance(data, list):
-            return self._parse_candles(data)
+    def _handle_trades(self, data: Any) -> List[MarketEvent]:
+        if not isinstance(data, list):
+            return []
+        return self._parse_trades(data)
 
-        if channel == "activeAssetCtx" and isinstance(data, Mapping):
-            ctx = self._parse_active_asset_ctx(data)
-            return [ctx] if ctx is not None else []
+    def _handle_candles(self, data: Any) -> List[MarketEvent]:
+        if not isinstance(data, list):
+            return []
+        return self._parse_candles(data)
 
-        # Unknown channel or shape
-        return []
+    def _handle_active_asset_ctx(self, data: Any) -> List[MarketEvent]:
+        if not isinstance(data, Mapping):
+            return []
+        ctx = self._parse_active_asset_ctx(data)
+        return [ctx] if ctx is not None else []
+
+    _DISPATCH: Dict[str, Callable[["HyperliquidMessageParser", Any], List[MarketEvent]]] = {
+        "l2Book": _handle_l2_book,
+        "bbo": _handle_bbo,
+        "trades": _handle_trades,
+        "candle": _handle_candles,
+        "activeAssetCtx": _handle_active_asset_ctx,
+    }
 
     # ------------------------------------------------------------------
     # Specific channel parsers
     # ------------------------------------------------------------------
 
     def _coin_matches(self, coin: Optional[str]) -> bool:
-        return self._coin is None or coin == self._coin
+        own = self._coin
+        return own is None or coin is own or coin == own
+
+    def _event_coin(self, coin: Any) -> str:
+        """Coin string to store on an event that passed :meth:`_coin_matches`.
+
+        With a coin filter every event shares the parser's interned symbol
+        instead of holding its own freshly decoded copy.
+        """
+
+        own = self._coin
+        return own if own is not None else sys.intern(str(coin))
 
     def _parse_l2_book(self, data: Mapping[str, Any]) -> Optional[OrderBookSnapshot]:
         coin = data.get("coin")
@@ -140,10 +190,10 @@ class HyperliquidMessageParser:
             return None
 
         bids_raw, asks_raw = levels
-        bids = [self._parse_level(level) for level in bids_raw]
-        asks = [self._parse_level(level) for level in asks_raw]
+        bids = self._parse_levels(bids_raw)
+        asks = self._parse_levels(asks_raw)
 
-        return OrderBookSnapshot(coin=str(coin), time_ms=time_ms, bids=bids, asks=asks)
+        return OrderBookSnapshot(coin=self._event_coin(coin), time_ms=time_ms, bids=bids, asks=asks)
 
     def _parse_bbo(self, data: Mapping[str, Any]) -> Optional[Bbo]:
         coin = data.get("coin")
@@ -156,39 +206,45 @@ class HyperliquidMessageParser:
             return None
 
         raw_bid, raw_ask = bbo_field
-        best_bid = self._parse_level(raw_bid) if isinstance(raw_bid, Mapping) else None
-        best_ask = self._parse_level(raw_ask) if isinstance(raw_ask, Mapping) else None
+        best_bid = self._parse_level(raw_bid) if isinstance(raw_bid, _LEVEL_TYPES) else None
+        best_ask = self._parse_level(raw_ask) if isinstance(raw_ask, _LEVEL_TYPES) else None
 
-        return Bbo(coin=str(coin), time_ms=time_ms, best_bid=best_bid, best_ask=best_ask)
+        return Bbo(coin=self._event_coin(coin), time_ms=time_ms, best_bid=best_bid, best_ask=best_ask)
 
     def _parse_trades(self, trades: Iterable[Mapping[str, Any]]) -> List[TradeEvent]:
         events: List[TradeEvent] = []
+
+        # Bind per-call lookups once; this loop runs for every trade
+        append = events.append
+        coin_matches = self._coin_matches
+        event_coin = self._event_coin
+        trade_cls = TradeEvent
+        to_float = float
+        to_int = int
+        to_str = str
+
         for trade in trades:
-            coin = trade.get("coin")
-            if not self._coin_matches(coin):
+            get = trade.get
+            coin = get("coin")
+            if not coin_matches(coin):
                 continue
 
-            px = float(trade.get("px", 0.0))
-            sz = float(trade.get("sz", 0.0))
-            side = str(trade.get("side", ""))
-            time_ms = int(trade.get("time", 0))
-            tid = int(trade.get("tid", 0))
-            hash_value = trade.get("hash")
-            users = trade.get("users") or [None, None]
+            hash_value = get("hash")
+            users = get("users") or [None, None]
             buyer = users[0] if len(users) > 0 else None
             seller = users[1] if len(users) > 1 else None
 
-            events.append(
-                TradeEvent(
-                    coin=str(coin),
-                    side=side,
-                    px=px,
-                    sz=sz,
-                    time_ms=time_ms,
-                    tid=tid,
-                    hash=str(hash_value) if hash_value is not None else None,
-                    buyer=str(buyer) if buyer is not None else None,
-                    seller=str(seller) if seller is not None else None,
+            append(
+                trade_cls(
+                    coin=event_coin(coin),
+                    side=to_str(get("side", "")),
+                    px=to_float(get("px", 0.0)),
+                    sz=to_float(get("sz", 0.0)),
+                    time_ms=to_int(get("time", 0)),
+                    tid=to_int(get("tid", 0)),
+                    hash=to_str(hash_value) if hash_value is not None else None,
+                    buyer=to_str(buyer) if buyer is not None else None,
+                    seller=to_str(seller) if seller is not None else None,
                 )
             )
 
@@ -198,33 +254,33 @@ class HyperliquidMessageParser:
 
     def _parse_candles(self, candles: Iterable[Mapping[str, Any]]) -> List[CandleEvent]:
         events: List[CandleEvent] = []
+
+        # Bind per-call lookups once; this loop runs for every candle
+        append = events.append
+        coin_matches = self._coin_matches
+        event_coin = self._event_coin
+        candle_cls = CandleEvent
+        to_float = float
+        to_int = int
+
         for candle in candles:
-            coin = candle.get("s")
-            if not self._coin_matches(coin):
+            get = candle.get
+            coin = get("s")
+            if not coin_matches(coin):
                 continue
 
-            open_time_ms = int(candle.get("t", 0))
-            close_time_ms = int(candle.get("T", 0))
-            interval = str(candle.get("i", ""))
-            open_px = float(candle.get("o", 0.0))
-            close_px = float(candle.get("c", 0.0))
-            high_px = float(candle.get("h", 0.0))
-            low_px = float(candle.get("l", 0.0))
-            volume = float(candle.get("v", 0.0))
-            n_trades = int(candle.get("n", 0))
-
-            events.append(
-                CandleEvent(
-                    coin=str(coin),
-                    interval=interval,
-                    open_time_ms=open_time_ms,
-                    close_time_ms=close_time_ms,
-                    open=open_px,
-                    high=high_px,
-                    low=low_px,
-                    close=close_px,
-                    volume=volume,
-                    n_trades=n_trades,
+            append(
+                candle_cls(
+                    coin=event_coin(coin),
+                    interval=str(get("i", "")),
+                    open_time_ms=to_int(get("t", 0)),
+                    close_time_ms=to_int(get("T", 0)),
+                    open=to_float(get("o", 0.0)),
+                    high=to_float(get("h", 0.0)),
+                    low=to_float(get("l", 0.0)),
+                    close=to_float(get("c", 0.0)),
+                    volume=to_float(get("v", 0.0)),
+                    n_trades=to_int(get("n", 0)),
                 )
             )
 
@@ -256,7 +312,7 @@ class HyperliquidMessageParser:
         day_base_volume = float(day_base_vlm_value) if day_base_vlm_value is not None else None
 
         return PerpAssetContext(
-            coin=str(coin),
+            coin=self._event_coin(coin),
             day_notional_volume=day_ntl_vlm,
             prev_day_px=prev_day_px,
             mark_px=mark_px,
@@ -269,7 +325,49 @@ class HyperliquidMessageParser:
         )
 
     @staticmethod
-    def _parse_level(level: Mapping[str, Any]) -> OrderBookLevel:
+    def _parse_levels(levels: Sequence[Any]) -> List[OrderBookLevel]:
+        # Book snapshots carry dozens of levels per side; build them in one
+        # comprehension with locally bound names instead of a call per level.
+        # Levels arrive either as {"px", "sz", "n"} objects or as compact
+        # [px, sz, n] arrays; the fast path picks the shape from the first
+        # level and falls back to per-level parsing if any level disagrees.
+        level_cls = OrderBookLevel
+        to_float = float
+        to_int = int
+        try:
+            if levels and isinstance(levels[0], (list, tuple)):
+                return [
+                    level_cls(to_float(level[0]), to_float(level[1]), to_int(level[2]))
+                    for level in levels
+                ]
+            return [
+                level_cls(
+                    to_float(level.get("px", 0.0)),
+                    to_float(level.get("sz", 0.0)),
+                    to_int(level.get("n", 0)),
+                )
+                for level in levels
+            ]
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+            pass
+
+        # Mixed or malformed levels: parse each by its own shape and skip
+        # the ones that can't be read
+        parse_level = HyperliquidMessageParser._parse_level
+        parsed = []
+        for level in levels:
+            if not isinstance(level, _LEVEL_TYPES):
+                continue
+            try:
+                parsed.append(parse_level(level))
+            except (IndexError, TypeError, ValueError):
+                continue
+        return parsed
+
+    @staticmethod
+    def _parse_level(level: Union[Mapping[str, Any], Sequence[Any]]) -> OrderBookLevel:
+        if isinstance(level, (list, tuple)):
+            return OrderBookLevel(px=float(level[0]), sz=float(level[1]), n=int(level[2]))
         return OrderBookLevel(
             px=float(level.get("px", 0.0)),
             sz=float(level.get("sz", 0.0)),
@@ -277,6 +375,66 @@ class HyperliquidMessageParser:
         )
 
 
+class _EventRing:
+    """Growable single-producer/single-consumer ring buffer of events.
+
+    Events are stored in a preallocated list indexed by two ever-increasing
+    counters: ``_tail`` is only written by the producer (the transport
+    thread calling :meth:`HyperliquidClient.feed_raw_message`) and ``_head``
+    only by the consumer (:meth:`HyperliquidClient.iter_events`). Each slot
+    is written before the tail is published, so the two sides never need a
+    lock. When full, the producer doubles the capacity instead of dropping
+    events; the consumer always indexes the list it read, so a concurrent
+    grow is safe.
+    """
+
+    __slots__ = ("_slots", "_head", "_tail")
+
+    def __init__(self, capacity: int = 1024) -> None:
+        # Capacity must be a power of two so indices can be masked
+        size = 1
+        while size < capacity:
+            size *= 2
+        self._slots: List[Optional[MarketEvent]] = [None] * size
+        self._head = 0
+        self._tail = 0
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    def push(self, event: MarketEvent) -> None:
+        """Append an event (producer side)."""
+
+        slots = self._slots
+        tail = self._tail
+        if tail - self._head == len(slots):
+            slots = self._grow(slots, tail)
+        slots[tail & (len(slots) - 1)] = event
+        self._tail = tail + 1
+
+    def pop(self) -> Optional[MarketEvent]:
+        """Remove and return the oldest event, or ``None`` if empty (consumer side)."""
+
+        head = self._head
+        if head == self._tail:
+            return None
+        slots = self._slots
+        idx = head & (len(slots) - 1)
+        event = slots[idx]
+        slots[idx] = None
+        self._head = head + 1
+        return event
+
+    def _grow(self, slots: List[Optional[MarketEvent]], tail: int) -> List[Optional[MarketEvent]]:
+        old_mask = len(slots) - 1
+        new_slots: List[Optional[MarketEvent]] = [None] * (len(slots) * 2)
+        new_mask = len(new_slots) - 1
+        for i in range(self._head, tail):
+            new_slots[i & new_mask] = slots[i & old_mask]
+        self._slots = new_slots
+        return new_slots
+
+
 class HyperliquidClient:
     """Single-coin Hyperliquid public data client.
 
@@ -316,7 +474,7 @@ class HyperliquidClient:
         self._parser = parser or HyperliquidMessageParser(coin=coin)
         self._transport = transport
 
-        self._buffer: Deque[MarketEvent] = deque()
+        self._buffer = _EventRing()
         self._closed: bool = False
 
     @property
@@ -342,8 +500,9 @@ class HyperliquidClient:
         if self._closed:
             return
 
-        events = self._parser.parse_message(message)
-        self._buffer.extend(events)
+        push = self._buffer.push
+        for event in self._parser.parse_message(message):
+            push(event)
 
     def iter_events(self) -> Iterator[MarketEvent]:
         """Iterate over all buffered events in FIFO order.
@@ -354,8 +513,11 @@ class HyperliquidClient:
         events.
         """
 
-        while self._buffer:
-            yield self._buffer.popleft()
+        pop = self._buffer.pop
+        event = pop()
+        while event is not None:
+            yield event
+            event = pop()
 
     def connect_and_subscribe(self) -> None:
         """Connect to Hyperliquid and start consuming public data streams.
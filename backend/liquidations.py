@@ -12,13 +12,31 @@ Note: This is estimation-based, not definitive liquidation data.
 from __future__ import annotations
 
 import time
+from bisect import bisect_left
 from collections import deque
 from dataclasses import dataclass
-from typing import Dict, Optional, Literal
+from enum import IntEnum
+from typing import Dict, Iterable, List, Optional, Literal, Tuple
 
 
 LiquidationSide = Literal["long", "short", "none"]
 
+# add_trade prunes history at most every N trades or T ms of event time;
+# cascade scans stop at their own cutoff, so stale entries are harmless
+_CLEANUP_EVERY_TRADES = 64
+_CLEANUP_INTERVAL_MS = 1000.0
+
+# Expired trades are compacted out of the columns once at least this many
+# have accumulated ahead of the live head
+_TRADE_COMPACT_MIN = 256
+
+
+class LiquidationReason(IntEnum):
+    """Why a trade was flagged as a suspected liquidation."""
+
+    LARGE_TRADE = 0
+    CASCADE = 1
+
 
 @dataclass
 class SuspectedLiquidation:
@@ -28,7 +46,20 @@ class SuspectedLiquidation:
     total_volume_usd: float
     price: float
     confidence: float  # 0.0 to 1.0
-    reason: str  # Why we think this is a liquidation
+    reason_code: LiquidationReason  # Why we think this is a liquidation
+    cascade_window_seconds: float = 0.0  # Window length (CASCADE only)
+
+    @property
+    def reason(self) -> str:
+        """Human-readable reason, formatted from ``reason_code`` on access."""
+        if self.reason_code is LiquidationReason.CASCADE:
+            return (
+                f"Trade cascade: ${self.total_volume_usd:,.0f} "
+                f"in {self.cascade_window_seconds}s"
+            )
+        # Long liquidation = forced sell, short = forced buy
+        taker_side = "sell" if self.side == "long" else "buy"
+        return f"Large ${self.total_volume_usd:,.0f} {taker_side} order"
 
 
 @dataclass
@@ -71,8 +102,33 @@ class LiquidationsDetector:
         self.large_trade_threshold = large_trade_threshold_usd
         self.cascade_window_ms = cascade_time_window_ms
 
+        # Per-trade invariants
+        self._confidence_scale = 1.0 / (large_trade_threshold_usd * 5)
+        self._cascade_window_s = cascade_time_window_ms / 1000
+
         self.suspected_liquidations: deque[SuspectedLiquidation] = deque()
-        self.recent_trades: deque = deque()  # For cascade detection
+
+        # Liquidation timestamps with inclusive running totals (long count,
+        # long/short USD volume), so window stats are a bisect on the
+        # timestamp axis plus a few subtractions instead of a rescan
+        self._liq_ts: list[float] = []
+        self._liq_long_count: list[int] = []
+        self._liq_long_volume: list[float] = []
+        self._liq_short_volume: list[float] = []
+
+        # Recent trades for cascade detection, stored as parallel columns
+        # (timestamp, USD size, taker side) rather than one dict per trade.
+        # Plain lists with a head offset: expiry just advances the head and
+        # the dead prefix is compacted in bulk, so columns stay contiguous
+        # and indexable (bisect) without per-trade pops.
+        self._trade_ts: list[float] = []
+        self._trade_size_usd: list[float] = []
+        self._trade_side: list[str] = []
+        self._trade_head = 0
+
+        # Amortized cleanup bookkeeping (see _CLEANUP_EVERY_TRADES)
+        self._trades_since_cleanup = 0
+        self._last_cleanup_ms = 0.0
 
     def add_trade(
         self,
@@ -100,22 +156,74 @@ class LiquidationsDetector:
             Suspected liquidation if detected, None otherwise
         """
         # Store trade for cascade detection
-        self.recent_trades.append({
-            'timestamp_ms': timestamp_ms,
-            'price': price,
-            'size_usd': size_usd,
-            'side': side,
-        })
+        self._trade_ts.append(timestamp_ms)
+        self._trade_size_usd.append(size_usd)
+        self._trade_side.append(side)
 
-        # Clean old trades
-        self._cleanup_old_data()
+        # Clean old trades (relative to this trade's event time), amortized
+        self._trades_since_cleanup += 1
+        if (
+            self._trades_since_cleanup >= _CLEANUP_EVERY_TRADES
+            or timestamp_ms - self._last_cleanup_ms >= _CLEANUP_INTERVAL_MS
+        ):
+            self._cleanup_old_data(timestamp_ms)
 
-        # Detection logic
+        return self._detect_liquidation(timestamp_ms, price, size_usd, side)
+
+    def add_trades(
+        self,
+        trades: Iterable[Tuple[float, float, float, str]],
+    ) -> List[SuspectedLiquidation]:
+        """Add a batch of trades, checking each one for a liquidation.
+
+        Equivalent to calling ``add_trade`` for each trade in order, but
+        history cleanup runs once for the whole batch.
+
+        Parameters:
+        -----------
+        trades : Iterable[Tuple[float, float, float, str]]
+            (timestamp_ms, price, size_usd, side) tuples in time order
+
+        Returns:
+        --------
+        List[SuspectedLiquidation]
+            Suspected liquidations detected in this batch, in order
+        """
+        append_ts = self._trade_ts.append
+        append_size = self._trade_size_usd.append
+        append_side = self._trade_side.append
+        detect = self._detect_liquidation
+
+        liquidations: List[SuspectedLiquidation] = []
+        count = 0
+        for timestamp_ms, price, size_usd, side in trades:
+            append_ts(timestamp_ms)
+            append_size(size_usd)
+            append_side(side)
+            count += 1
+
+            liquidation = detect(timestamp_ms, price, size_usd, side)
+            if liquidation:
+                liquidations.append(liquidation)
+
+        if count:
+            self._cleanup_old_data(timestamp_ms)
+
+        return liquidations
+
+    def _detect_liquidation(
+        self,
+        timestamp_ms: float,
+        price: float,
+        size_usd: float,
+        side: str,
+    ) -> Optional[SuspectedLiquidation]:
+        """Check the just-stored trade for a liquidation and record it."""
         liquidation = None
 
         # 1. Single large trade detection
         if size_usd >= self.large_trade_threshold:
-            confidence = min(size_usd / (self.large_trade_threshold * 5), 1.0)
+            confidence = min(size_usd * self._confidence_scale, 1.0)
             # Sell = long liquidation (forced to sell)
             # Buy = short liquidation (forced to buy/cover)
             liq_side = "long" if side == "sell" else "short"
@@ -126,30 +234,50 @@ class LiquidationsDetector:
                 total_volume_usd=size_usd,
                 price=price,
                 confidence=confidence,
-                reason=f"Large ${size_usd:,.0f} {side} order",
+                reason_code=LiquidationReason.LARGE_TRADE,
             )
 
         # 2. Cascade detection (multiple trades in quick succession)
-        elif self._detect_cascade(timestamp_ms, side):
-            cascade_volume = self._get_cascade_volume(timestamp_ms, side)
-            liq_side = "long" if side == "sell" else "short"
-
-            liquidation = SuspectedLiquidation(
-                timestamp_ms=timestamp_ms,
-                side=liq_side,
-                total_volume_usd=cascade_volume,
-                price=price,
-                confidence=0.7,  # Lower confidence for cascades
-                reason=f"Trade cascade: ${cascade_volume:,.0f} in {self.cascade_window_ms/1000}s",
-            )
+        else:
+            is_cascade, cascade_volume = self._scan_cascade(timestamp_ms, side)
+            if is_cascade:
+                liq_side = "long" if side == "sell" else "short"
+
+                liquidation = SuspectedLiquidation(
+                    timestamp_ms=timestamp_ms,
+                    side=liq_side,
+                    total_volume_usd=cascade_volume,
+                    price=price,
+                    confidence=0.7,  # Lower confidence for cascades
+                    reason_code=LiquidationReason.CASCADE,
+                    cascade_window_seconds=self._cascade_window_s,
+                )
 
         if liquidation:
-            self.suspected_liquidations.append(liquidation)
+            self._record_liquidation(liquidation)
 
         return liquidation
 
-    def _detect_cascade(self, current_timestamp_ms: float, side: str) -> bool:
-        """Detect if recent trades form a cascade pattern.
+    def _record_liquidation(self, liquidation: SuspectedLiquidation) -> None:
+        """Append a liquidation and extend the running totals."""
+        self.suspected_liquidations.append(liquidation)
+
+        long_count = self._liq_long_count[-1] if self._liq_long_count else 0
+        long_volume = self._liq_long_volume[-1] if self._liq_long_volume else 0.0
+        short_volume = self._liq_short_volume[-1] if self._liq_short_volume else 0.0
+        if liquidation.side == "long":
+            long_count += 1
+            long_volume += liquidation.total_volume_usd
+        elif liquidation.side == "short":
+            short_volume += liquidation.total_volume_usd
+
+        self._liq_ts.append(liquidation.timestamp_ms)
+        self._liq_long_count.append(long_count)
+        self._liq_long_volume.append(long_volume)
+        self._liq_short_volume.append(short_volume)
+
+    def _scan_cascade(self, current_timestamp_ms: float, side: str) -> Tuple[bool, float]:
+        """Detect a cascade and measure its volume in a single pass over the window.
 
         Parameters:
         -----------
@@ -160,65 +288,87 @@ class LiquidationsDetector:
 
         Returns:
         --------
-        bool
-            True if cascade detected
+        Tuple[bool, float]
+            (True if cascade detected, total same-side volume in USD)
         """
         cutoff_ms = current_timestamp_ms - self.cascade_window_ms
 
-        # Count trades in same direction within cascade window
+        # Timestamps are in arrival (time) order, so the window start is a
+        # binary search rather than a reverse scan comparing every timestamp
+        trade_size_usd = self._trade_size_usd
+        trade_side = self._trade_side
+        start = bisect_left(self._trade_ts, cutoff_ms, self._trade_head)
+
+        # Count trades in same direction within cascade window (newest first)
         same_direction_count = 0
         total_volume = 0.0
 
-        for trade in reversed(self.recent_trades):
-            if trade['timestamp_ms'] < cutoff_ms:
-                break
-
-            if trade['side'] == side:
+        for i in range(len(trade_side) - 1, start - 1, -1):
+            if trade_side[i] == side:
                 same_direction_count += 1
-                total_volume += trade['size_usd']
+                total_volume += trade_size_usd[i]
 
         # Cascade = 5+ trades in same direction within window, totaling significant volume
-        return same_direction_count >= 5 and total_volume >= self.large_trade_threshold
+        is_cascade = same_direction_count >= 5 and total_volume >= self.large_trade_threshold
+        return is_cascade, total_volume
 
-    def _get_cascade_volume(self, current_timestamp_ms: float, side: str) -> float:
-        """Get total volume of cascade.
-
-        Parameters:
-        -----------
-        current_timestamp_ms : float
-            Current timestamp
-        side : str
-            Trade side
+    def _now_ms(self) -> float:
+        """Current event time: the newest trade's timestamp.
 
-        Returns:
-        --------
-        float
-            Total volume in USD
+        Falls back to the wall clock only before any trade has been seen, so
+        windows stay consistent with exchange time even if it lags ours.
         """
-        cutoff_ms = current_timestamp_ms - self.cascade_window_ms
-        total = 0.0
-
-        for trade in reversed(self.recent_trades):
-            if trade['timestamp_ms'] < cutoff_ms:
-                break
-            if trade['side'] == side:
-                total += trade['size_usd']
+        if self._trade_ts:
+            return self._trade_ts[-1]
+        return time.time_ns() // 1_000_000
 
-        return total
+    def _cleanup_old_data(self, current_time_ms: float) -> None:
+        """Remove old data outside retention windows.
 
-    def _cleanup_old_data(self) -> None:
-        """Remove old data outside retention windows."""
-        current_time_ms = time.time() * 1000
+        Parameters:
+        -----------
+        current_time_ms : float
+            Reference time in milliseconds (event time, see ``_now_ms``)
+        """
+        self._trades_since_cleanup = 0
+        self._last_cleanup_ms = current_time_ms
 
         # Clean suspected liquidations (use max history for multi-timeframe support)
         cutoff_ms = current_time_ms - (self.max_history_seconds * 1000)
-        while self.suspected_liquidations and self.suspected_liquidations[0].timestamp_ms < cutoff_ms:
-            self.suspected_liquidations.popleft()
+        expired = bisect_left(self._liq_ts, cutoff_ms)
+        if expired:
+            self._evict_liquidations(expired)
 
         # Clean recent trades (use cascade window + buffer)
         trade_cutoff_ms = current_time_ms - (self.cascade_window_ms * 2)
-        while self.recent_trades and self.recent_trades[0]['timestamp_ms'] < trade_cutoff_ms:
-            self.recent_trades.popleft()
+        trade_ts = self._trade_ts
+        head = bisect_left(trade_ts, trade_cutoff_ms, self._trade_head)
+
+        # Compact once the dead prefix outweighs the live trades
+        if head > _TRADE_COMPACT_MIN and head * 2 > len(trade_ts):
+            del trade_ts[:head]
+            del self._trade_size_usd[:head]
+            del self._trade_side[:head]
+            head = 0
+        self._trade_head = head
+
+    def _evict_liquidations(self, count: int) -> None:
+        """Drop the oldest ``count`` liquidations and rebase the running totals.
+
+        Rebasing keeps the totals small, so window differences don't lose
+        precision as the detector runs for a long time.
+        """
+        for _ in range(count):
+            self.suspected_liquidations.popleft()
+
+        base_long_count = self._liq_long_count[count - 1]
+        base_long_volume = self._liq_long_volume[count - 1]
+        base_short_volume = self._liq_short_volume[count - 1]
+
+        del self._liq_ts[:count]
+        self._liq_long_count = [c - base_long_count for c in self._liq_long_count[count:]]
+        self._liq_long_volume = [v - base_long_volume for v in self._liq_long_volume[count:]]
+        self._liq_short_volume = [v - base_short_volume for v in self._liq_short_volume[count:]]
 
     def get_stats(self, window_seconds: Optional[float] = None) -> LiquidationStats:
         """Get liquidation statistics for a specific time window.
@@ -233,34 +383,43 @@ class LiquidationsDetector:
         LiquidationStats
             Statistics for the specified time window
         """
-        self._cleanup_old_data()
+        current_time_ms = self._now_ms()
+        self._cleanup_old_data(current_time_ms)
 
         if window_seconds is None:
             window_seconds = self.window_seconds
 
-        # Filter liquidations within the requested window
-        current_time_ms = time.time() * 1000
+        # Locate liquidations within the requested window
         cutoff_ms = current_time_ms - (window_seconds * 1000)
-        windowed_liq = [liq for liq in self.suspected_liquidations if liq.timestamp_ms >= cutoff_ms]
 
-        long_count = 0
-        short_count = 0
-        long_volume = 0.0
-        short_volume = 0.0
-        last_liq = None
-
-        for liq in windowed_liq:
-            if liq.side == "long":
-                long_count += 1
-                long_volume += liq.total_volume_usd
-            elif liq.side == "short":
-                short_count += 1
-                short_volume += liq.total_volume_usd
-
-            last_liq = liq  # Will end up being the most recent
+        # First liquidation inside the window; totals are inclusive, so the
+        # window sums are the last total minus the one just before it
+        liq_ts = self._liq_ts
+        first = bisect_left(liq_ts, cutoff_ms)
+        total_count = len(liq_ts) - first
+
+        if total_count:
+            long_counts = self._liq_long_count
+            long_volumes = self._liq_long_volume
+            short_volumes = self._liq_short_volume
+            if first:
+                long_count = long_counts[-1] - long_counts[first - 1]
+                long_volume = long_volumes[-1] - long_volumes[first - 1]
+                short_volume = short_volumes[-1] - short_volumes[first - 1]
+            else:
+                long_count = long_counts[-1]
+                long_volume = long_volumes[-1]
+                short_volume = short_volumes[-1]
+            short_count = total_count - long_count
+            last_liq = self.suspected_liquidations[-1]
+        else:
+            long_count = 0
+            short_count = 0
+            long_volume = 0.0
+            short_volume = 0.0
+            last_liq = None
 
         # Determine status
-        total_count = long_count + short_count
         if total_count == 0:
             status = "Normal"
         elif total_count < 3:
@@ -8,10 +8,45 @@ rest of the backend to consume normalized events from Hyperliquid.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import Optional, Union
 
 
-@dataclass(frozen=True)
+class Trend(IntEnum):
+    """Direction of an indicator trend (OI, funding, price)."""
+
+    UP = 0
+    DOWN = 1
+    FLAT = 2
+    RANGE = 3
+    UNKNOWN = 4
+
+    @property
+    def label(self) -> str:
+        """Lowercase name used at the formatting/serialization boundary."""
+        return _TREND_LABELS[self]
+
+    @classmethod
+    def parse(cls, value: Union["Trend", str]) -> "Trend":
+        """Coerce a trend string ("up", "rising", "stable", ...) to a member."""
+        if isinstance(value, Trend):
+            return value
+        return _TREND_ALIASES.get(value, cls.UNKNOWN)
+
+
+_TREND_LABELS = {member: member.name.lower() for member in Trend}
+_TREND_ALIASES = {
+    "up": Trend.UP,
+    "rising": Trend.UP,
+    "down": Trend.DOWN,
+    "falling": Trend.DOWN,
+    "flat": Trend.FLAT,
+    "stable": Trend.FLAT,
+    "range": Trend.RANGE,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class OrderBookLevel:
     """One level in the L2 order book.
 
@@ -30,7 +65,7 @@ class OrderBookLevel:
     n: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderBookSnapshot:
     """Full L2 snapshot for a single coin.
 
@@ -43,7 +78,7 @@ class OrderBookSnapshot:
     asks: list[OrderBookLevel]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Bbo:
     """Best bid/offer snapshot for a single coin.
 
@@ -73,7 +108,7 @@ class Bbo:
         return self.best_ask.px - self.best_bid.px
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TradeEvent:
     """Public trade event from the ``trades`` stream (``WsTrade``)."""
 
@@ -88,7 +123,7 @@ class TradeEvent:
     seller: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CandleEvent:
     """Bar/candle event from the ``candle`` stream.
 
@@ -108,7 +143,7 @@ class CandleEvent:
     n_trades: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PerpAssetContext:
     """Per-asset context snapshot from ``activeAssetCtx`` (perps only).
 
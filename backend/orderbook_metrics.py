@@ -12,28 +12,35 @@ All calculations are based on the orderbook state from L2Book WebSocket events.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Tuple, Optional
-from decimal import Decimal
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OrderBookLevel:
     """A single price level in the orderbook."""
     price: float
     size: float  # Quantity in base asset (e.g., SOL)
+    notional_usd: float = field(init=False)  # price * size, computed once
 
-    @property
-    def notional_usd(self) -> float:
-        """Total USD value at this level."""
-        return self.price * self.size
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "notional_usd", self.price * self.size)
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderBookSide:
-    """One side of the orderbook (bids or asks)."""
+    """One side of the orderbook (bids or asks).
+
+    ``levels`` is treated as immutable once the side is built (a new side is
+    created per book snapshot), which lets cumulative depth be cached.
+    """
     levels: List[OrderBookLevel]  # Sorted: bids descending, asks ascending
 
+    # Inclusive prefix sums of level notional, built on first depth query
+    _cum_depth: Optional[List[float]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def best_price(self) -> Optional[float]:
         """Best price on this side (highest bid or lowest ask)."""
@@ -48,12 +55,25 @@ class OrderBookSide:
             return None
         return self.levels[0].size
 
+    def _cumulative_depths(self) -> List[float]:
+        """Cumulative USD depth after each level, computed once per side."""
+        cum = self._cum_depth
+        if cum is None:
+            cum = []
+            total = 0.0
+            for level in self.levels:
+                total += level.notional_usd
+                cum.append(total)
+            self._cum_depth = cum
+        return cum
+
     def cumulative_depth_usd(self, num_levels: int = 5) -> float:
         """Cumulative depth in USD for top N levels."""
-        total = 0.0
-        for i, level in enumerate(self.levels[:num_levels]):
-            total += level.notional_usd
-        return total
+        cum = self._cumulative_depths()
+        n = min(num_levels, len(cum))
+        if n <= 0:
+            return 0.0
+        return cum[n - 1]
 
     def depth_by_level(self, max_levels: int = 5) -> List[float]:
         """Cumulative depth in USD for each level up to max_levels.
@@ -61,38 +81,65 @@ class OrderBookSide:
         Returns:
             List of cumulative USD depth for L1, L2, ..., L{max_levels}
         """
-        depths = []
-        cumulative = 0.0
-        for i, level in enumerate(self.levels[:max_levels]):
-            cumulative += level.notional_usd
-            depths.append(cumulative)
-        return depths
+        return self._cumulative_depths()[:max(max_levels, 0)]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OrderBook:
-    """Full orderbook state."""
+    """Full orderbook state.
+
+    Frozen, so the best prices, mid and spread derived once in
+    ``__post_init__`` always describe the sides the book was built with.
+    """
     bids: OrderBookSide
     asks: OrderBookSide
     timestamp_ms: float  # Unix timestamp in milliseconds
 
-    @property
-    def mid_price(self) -> Optional[float]:
-        """Mid price between best bid and ask."""
+    _best_bid: Optional[float] = field(init=False, repr=False, compare=False)
+    _best_ask: Optional[float] = field(init=False, repr=False, compare=False)
+    _mid_price: Optional[float] = field(init=False, repr=False, compare=False)
+    _spread_absolute: Optional[float] = field(init=False, repr=False, compare=False)
+    _spread_bps: Optional[float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
         best_bid = self.bids.best_price
         best_ask = self.asks.best_price
+        object.__setattr__(self, "_best_bid", best_bid)
+        object.__setattr__(self, "_best_ask", best_ask)
+
         if best_bid is None or best_ask is None:
-            return None
-        return (best_bid + best_ask) / 2.0
+            object.__setattr__(self, "_mid_price", None)
+            object.__setattr__(self, "_spread_absolute", None)
+            object.__setattr__(self, "_spread_bps", None)
+            return
+
+        mid = (best_bid + best_ask) / 2.0
+        spread = best_ask - best_bid
+        object.__setattr__(self, "_mid_price", mid)
+        object.__setattr__(self, "_spread_absolute", spread)
+        object.__setattr__(
+            self, "_spread_bps", None if mid == 0 else (spread / mid) * 10000.0
+        )
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        """Highest bid price."""
+        return self._best_bid
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        """Lowest ask price."""
+        return self._best_ask
+
+    @property
+    def mid_price(self) -> Optional[float]:
+        """Mid price between best bid and ask."""
+        return self._mid_price
 
     @property
     def spread_absolute(self) -> Optional[float]:
         """Absolute spread (ask - bid)."""
-        best_bid = self.bids.best_price
-        best_ask = self.asks.best_price
-        if best_bid is None or best_ask is None:
-            return None
-        return best_ask - best_bid
+        return self._spread_absolute
 
     @property
     def spread_bps(self) -> Optional[float]:
@@ -100,11 +147,7 @@ class OrderBook:
 
         bps = (spread / mid_price) * 10000
         """
-        spread = self.spread_absolute
-        mid = self.mid_price
-        if spread is None or mid is None or mid == 0:
-            return None
-        return (spread / mid) * 10000.0
+        return self._spread_bps
 
     def l1_depth_usd(self) -> Tuple[float, float]:
         """L1 depth in USD for (bids, asks)."""
@@ -136,6 +179,18 @@ class OrderBook:
         ask_depth = self.asks.cumulative_depth_usd(5)
         return (bid_depth, ask_depth)
 
+    def depths_l1_to_l5(self) -> Tuple[Tuple[float, float], ...]:
+        """Cumulative depth in USD for (bids, asks) at L1..L5.
+
+        Both sides come from one prefix-sum pass, so this replaces five
+        separate ``lN_depth_usd`` calls. Missing levels repeat the side's
+        total, matching ``cumulative_depth_usd``.
+        """
+        return tuple(
+            (self.bids.cumulative_depth_usd(n), self.asks.cumulative_depth_usd(n))
+            for n in range(1, 6)
+        )
+
     def imbalance(self, bid_depth: float, ask_depth: float) -> float:
         """Calculate imbalance ratio.
 
@@ -169,17 +224,22 @@ class OrderBook:
         bid_depths = self.bids.depth_by_level(max_levels)
         ask_depths = self.asks.depth_by_level(max_levels)
 
+        # Pad the shorter side with 0.0 once up front so the loop below
+        # needs no per-level bounds checks (depth_by_level returns a copy)
+        n = max(len(bid_depths), len(ask_depths))
+        bid_depths += [0.0] * (n - len(bid_depths))
+        ask_depths += [0.0] * (n - len(ask_depths))
+
         results = []
-        for i in range(max(len(bid_depths), len(ask_depths))):
-            bid_cum = bid_depths[i] if i < len(bid_depths) else 0.0
-            ask_cum = ask_depths[i] if i < len(ask_depths) else 0.0
-            imb = self.imbalance(bid_cum, ask_cum)
+        for bid_cum, ask_cum in zip(bid_depths, ask_depths):
+            total = bid_cum + ask_cum
+            imb = (bid_cum - ask_cum) / total if total != 0 else 0.0
             results.append((bid_cum, ask_cum, imb))
 
         return results
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LiquidityMetrics:
     """Liquidity metrics for a specific trade size."""
     trade_size_usd: float
@@ -194,37 +254,103 @@ class LiquidityMetrics:
     is_filled: bool  # Whether order can be fully filled
 
 
-def calculate_liquidity_metrics(
-    orderbook: OrderBook,
+def _walk_levels(
+    levels: List[OrderBookLevel],
     trade_size_usd: float,
-    side: str,
-) -> LiquidityMetrics:
-    """Calculate liquidity metrics for a given trade size.
+) -> Tuple[int, float, float, float]:
+    """Walk levels until ``trade_size_usd`` is filled or the side runs out.
 
-    Parameters:
-    -----------
-    orderbook : OrderBook
-        Current orderbook state
-    trade_size_usd : float
-        Trade size in USD
-    side : str
-        "buy" (consume asks) or "sell" (consume bids)
+    Hot loop: each level's attributes are read once into locals.
 
     Returns:
-    --------
-    LiquidityMetrics
-        Calculated metrics for this trade size
+        (levels_consumed, executed_usd, executed_qty, remaining_usd)
     """
-    # Select the side we're consuming
-    if side == "buy":
-        levels = orderbook.asks.levels
-        reference_price = orderbook.asks.best_price
-    elif side == "sell":
-        levels = orderbook.bids.levels
-        reference_price = orderbook.bids.best_price
-    else:
-        raise ValueError(f"Invalid side: {side}. Must be 'buy' or 'sell'")
+    remaining_usd = trade_size_usd
+    executed_qty = 0.0
+    executed_usd = 0.0
+    levels_consumed = 0
 
+    for level in levels:
+        if remaining_usd <= 0:
+            break
+
+        levels_consumed += 1
+        price = level.price
+        size = level.size
+        level_usd = level.notional_usd
+
+        if level_usd >= remaining_usd:
+            # This level can fill the remaining order
+            executed_qty += remaining_usd / price
+            executed_usd += remaining_usd
+            remaining_usd = 0.0
+            break
+
+        # Consume this entire level and move to next
+        executed_qty += size
+        executed_usd += level_usd
+        remaining_usd -= level_usd
+
+    return levels_consumed, executed_usd, executed_qty, remaining_usd
+
+
+def _walk_levels_for_sizes(
+    levels: List[OrderBookLevel],
+    sorted_sizes_usd: List[float],
+) -> List[Tuple[int, float, float, float]]:
+    """``_walk_levels`` for several ascending trade sizes in one pass.
+
+    Levels fully consumed by a smaller size are also fully consumed by every
+    larger one, so the walk resumes where the previous size stopped instead
+    of restarting from the top of the book.
+
+    Returns:
+        One (levels_consumed, executed_usd, executed_qty, remaining_usd)
+        tuple per size, in the order given
+    """
+    results = []
+    n = len(levels)
+    i = 0
+    full_usd = 0.0  # USD of levels[:i], all fully consumed
+    full_qty = 0.0
+
+    for trade_size_usd in sorted_sizes_usd:
+        if trade_size_usd <= 0:
+            results.append((0, 0.0, 0.0, trade_size_usd))
+            continue
+
+        # Consume whole levels while they can't fill the rest of the order
+        while i < n:
+            level = levels[i]
+            level_usd = level.notional_usd
+            if level_usd >= trade_size_usd - full_usd:
+                break
+            full_usd += level_usd
+            full_qty += level.size
+            i += 1
+
+        if i < n:
+            # levels[i] fills the remainder
+            remaining_usd = trade_size_usd - full_usd
+            results.append((
+                i + 1,
+                full_usd + remaining_usd,
+                full_qty + remaining_usd / levels[i].price,
+                0.0,
+            ))
+        else:
+            results.append((n, full_usd, full_qty, trade_size_usd - full_usd))
+
+    return results
+
+
+def _build_liquidity_metrics(
+    trade_size_usd: float,
+    side: str,
+    reference_price: Optional[float],
+    walk: Tuple[int, float, float, float],
+) -> LiquidityMetrics:
+    """Turn a level walk result into ``LiquidityMetrics``."""
     if reference_price is None:
         # No liquidity available
         return LiquidityMetrics(
@@ -238,30 +364,7 @@ def calculate_liquidity_metrics(
             is_filled=False,
         )
 
-    # Walk through orderbook levels and accumulate execution
-    remaining_usd = trade_size_usd
-    executed_qty_total = 0.0
-    executed_usd_total = 0.0
-    levels_consumed = 0
-
-    for level in levels:
-        if remaining_usd <= 0:
-            break
-
-        levels_consumed += 1
-        level_usd_available = level.notional_usd
-
-        if level_usd_available >= remaining_usd:
-            # This level can fill the remaining order
-            qty_from_level = remaining_usd / level.price
-            executed_qty_total += qty_from_level
-            executed_usd_total += remaining_usd
-            remaining_usd = 0.0
-        else:
-            # Consume this entire level and move to next
-            executed_qty_total += level.size
-            executed_usd_total += level_usd_available
-            remaining_usd -= level_usd_available
+    levels_consumed, executed_usd_total, executed_qty_total, remaining_usd = walk
 
     # Check if order is fully filled
     is_filled = (remaining_usd <= 0.01)  # Allow small rounding errors
@@ -296,12 +399,51 @@ def calculate_liquidity_metrics(
     )
 
 
+def calculate_liquidity_metrics(
+    orderbook: OrderBook,
+    trade_size_usd: float,
+    side: str,
+) -> LiquidityMetrics:
+    """Calculate liquidity metrics for a given trade size.
+
+    Parameters:
+    -----------
+    orderbook : OrderBook
+        Current orderbook state
+    trade_size_usd : float
+        Trade size in USD
+    side : str
+        "buy" (consume asks) or "sell" (consume bids)
+
+    Returns:
+    --------
+    LiquidityMetrics
+        Calculated metrics for this trade size
+    """
+    # Select the side we're consuming
+    if side == "buy":
+        levels = orderbook.asks.levels
+        reference_price = orderbook.best_ask
+    elif side == "sell":
+        levels = orderbook.bids.levels
+        reference_price = orderbook.best_bid
+    else:
+        raise ValueError(f"Invalid side: {side}. Must be 'buy' or 'sell'")
+
+    # Walk through orderbook levels and accumulate execution
+    walk = _walk_levels(levels, trade_size_usd) if reference_price is not None else None
+    return _build_liquidity_metrics(trade_size_usd, side, reference_price, walk)
+
+
 def calculate_liquidity_by_trade_sizes(
     orderbook: OrderBook,
     trade_sizes_usd: List[float] = [20, 100, 500, 1000, 5000],
 ) -> List[Tuple[LiquidityMetrics, LiquidityMetrics]]:
     """Calculate liquidity metrics for multiple trade sizes.
 
+    Each side of the book is walked once for all sizes (smallest first)
+    rather than once per size.
+
     Parameters:
     -----------
     orderbook : OrderBook
@@ -314,15 +456,28 @@ def calculate_liquidity_by_trade_sizes(
     List[Tuple[LiquidityMetrics, LiquidityMetrics]]
         List of (buy_metrics, sell_metrics) for each trade size
     """
-    results = []
-    for size in trade_sizes_usd:
-        buy_metrics = calculate_liquidity_metrics(orderbook, size, "buy")
-        sell_metrics = calculate_liquidity_metrics(orderbook, size, "sell")
-        results.append((buy_metrics, sell_metrics))
+    if not trade_sizes_usd:
+        return []
+
+    order = sorted(range(len(trade_sizes_usd)), key=trade_sizes_usd.__getitem__)
+    sorted_sizes = [trade_sizes_usd[i] for i in order]
+
+    best_ask = orderbook.best_ask
+    best_bid = orderbook.best_bid
+    buy_walks = _walk_levels_for_sizes(orderbook.asks.levels, sorted_sizes)
+    sell_walks = _walk_levels_for_sizes(orderbook.bids.levels, sorted_sizes)
+
+    results: List[Optional[Tuple[LiquidityMetrics, LiquidityMetrics]]] = [None] * len(order)
+    for rank, i in enumerate(order):
+        size = sorted_sizes[rank]
+        results[i] = (
+            _build_liquidity_metrics(size, "buy", best_ask, buy_walks[rank]),
+            _build_liquidity_metrics(size, "sell", best_bid, sell_walks[rank]),
+        )
     return results
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OrderBookMetricsSummary:
     """Complete summary of orderbook metrics."""
     timestamp_ms: float
@@ -370,8 +525,9 @@ def calculate_all_metrics(
         Complete metrics summary
     """
     # Basic metrics
-    l1_bid, l1_ask = orderbook.l1_depth_usd()
-    l5_bid, l5_ask = orderbook.l5_depth_usd()
+    depths = orderbook.depths_l1_to_l5()
+    l1_bid, l1_ask = depths[0]
+    l5_bid, l5_ask = depths[4]
 
     # Depth and imbalance by level
     depth_by_level = orderbook.depth_and_imbalance_by_level(max_levels=5)
@@ -384,14 +540,14 @@ def calculate_all_metrics(
         mid_price=orderbook.mid_price,
         spread_absolute=orderbook.spread_absolute,
         spread_bps=orderbook.spread_bps,
-        best_bid=orderbook.bids.best_price,
-        best_ask=orderbook.asks.best_price,
+        best_bid=orderbook.best_bid,
+        best_ask=orderbook.best_ask,
         l1_depth_bid_usd=l1_bid,
         l1_depth_ask_usd=l1_ask,
         l5_depth_bid_usd=l5_bid,
         l5_depth_ask_usd=l5_ask,
-        l1_imbalance=orderbook.l1_imbalance(),
-        l5_imbalance=orderbook.l5_imbalance(),
+        l1_imbalance=orderbook.imbalance(l1_bid, l1_ask),
+        l5_imbalance=orderbook.imbalance(l5_bid, l5_ask),
         depth_by_level=depth_by_level,
         liquidity_by_size=liquidity_by_size,
     )
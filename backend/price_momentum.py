@@ -13,26 +13,32 @@ Calculates:
 from __future__ import annotations
 
 import time
-from collections import deque
+from bisect import bisect_left
 from dataclasses import dataclass
 from typing import Optional, Literal
 
 
 TrendDirection = Literal["up", "down", "flat"]
 
+# Direction names indexed by direction code (flat=0, up=1, down=2)
+_DIRECTIONS: tuple[TrendDirection, ...] = ("flat", "up", "down")
+_DIR_SYMBOLS = ("→", "↑", "↓")
 
-@dataclass
-class PricePoint:
-    """A single price observation."""
-    timestamp_ms: float  # Unix timestamp in milliseconds
-    price: float
+# Expired price points are compacted out of the history columns once at
+# least this many have accumulated ahead of the live head
+_HISTORY_COMPACT_MIN = 256
 
+# Cleanup is skipped when it already ran within this many milliseconds, so
+# a tick that adds a price and then reads momentum only trims history once
+_CLEANUP_INTERVAL_MS = 50.0
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class MomentumStats:
     """Momentum statistics for a time window."""
     window_seconds: float
     direction: TrendDirection
+    direction_code: int  # Index into _DIRECTIONS: 0=flat, 1=up, 2=down
     change_percent: float  # Percentage change from start to latest
     latest_price: float
     start_price: float
@@ -40,6 +46,20 @@ class MomentumStats:
     is_usable: bool  # Whether we have enough data for reliable signal
 
 
+# Returned in place of None when a window has no data, so callers can
+# branch on is_usable alone
+EMPTY_MOMENTUM = MomentumStats(
+    window_seconds=0,
+    direction="flat",
+    direction_code=0,
+    change_percent=0.0,
+    latest_price=0.0,
+    start_price=0.0,
+    latest_timestamp_ms=0.0,
+    is_usable=False,
+)
+
+
 class PriceMomentumTracker:
     """Tracks price momentum over multiple time windows."""
 
@@ -48,6 +68,7 @@ class PriceMomentumTracker:
         short_window_seconds: float = 5.0,
         long_window_seconds: float = 20.0,
         flat_threshold_percent: float = 0.01,  # 0.01% = 1 bps
+        expected_updates_per_second: float = 20.0,
     ):
         """Initialize price momentum tracker.
 
@@ -60,15 +81,35 @@ class PriceMomentumTracker:
         flat_threshold_percent : float, default 0.01
             Percentage threshold for flat detection (absolute value)
             e.g., 0.01 = +/- 0.01% = +/- 1 bps
+        expected_updates_per_second : float, default 20.0
+            Expected price update rate, used to cap retained history; during
+            bursts above this rate the oldest points are dropped first
         """
         self.short_window_seconds = short_window_seconds
         self.long_window_seconds = long_window_seconds
         self.flat_threshold_percent = flat_threshold_percent
 
-        # Store price points in a deque for efficient removal of old data
-        self.price_history: deque[PricePoint] = deque()
+        # Price history as parallel columns (timestamp, price) in arrival
+        # order. Expiry advances a head offset and the dead prefix is
+        # compacted in bulk; the sorted timestamp column makes window
+        # starts a binary search.
+        self._timestamps_ms: list[float] = []
+        self._prices: list[float] = []
+        self._head = 0
 
-    def add_price(self, price: float, timestamp_ms: Optional[float] = None) -> None:
+        # Hard cap on live points (longest window + 10%, plus headroom) so a
+        # burst can't grow history faster than age-based cleanup trims it
+        max_window = max(short_window_seconds, long_window_seconds)
+        self._max_points = int(max_window * expected_updates_per_second * 1.1) + 64
+
+        self._last_cleanup_ms = -_CLEANUP_INTERVAL_MS
+
+    def add_price(
+        self,
+        price: float,
+        timestamp_ms: Optional[float] = None,
+        now_ms: Optional[float] = None,
+    ) -> None:
         """Add a new price observation.
 
         Parameters:
@@ -77,65 +118,94 @@ class PriceMomentumTracker:
             Current price
         timestamp_ms : float, optional
             Timestamp in milliseconds. If None, uses current time.
+        now_ms : float, optional
+            Current wall-clock time in milliseconds, if the caller already
+            has it. If None, the clock is read here.
         """
+        if now_ms is None:
+            now_ms = time.time() * 1000
         if timestamp_ms is None:
-            timestamp_ms = time.time() * 1000
+            timestamp_ms = now_ms
 
-        self.price_history.append(PricePoint(timestamp_ms=timestamp_ms, price=price))
-        self._cleanup_old_prices()
+        self._timestamps_ms.append(timestamp_ms)
+        self._prices.append(price)
+        if len(self._timestamps_ms) - self._head > self._max_points:
+            self._head += 1
+        self._cleanup_old_prices(now_ms)
 
-    def _cleanup_old_prices(self) -> None:
+    def _cleanup_old_prices(self, current_time_ms: float) -> None:
         """Remove prices older than the longest window."""
-        if not self.price_history:
+        if 0 <= current_time_ms - self._last_cleanup_ms < _CLEANUP_INTERVAL_MS:
+            return
+        self._last_cleanup_ms = current_time_ms
+
+        timestamps = self._timestamps_ms
+        if self._head == len(timestamps):
             return
 
         # Keep data for longest window + 10% buffer
         max_window = max(self.short_window_seconds, self.long_window_seconds)
         retention_window_ms = max_window * 1000 * 1.1
 
-        current_time_ms = time.time() * 1000
         cutoff_time_ms = current_time_ms - retention_window_ms
 
-        # Remove old prices from the left
-        while self.price_history and self.price_history[0].timestamp_ms < cutoff_time_ms:
-            self.price_history.popleft()
+        # Drop old prices from the left by advancing the head
+        head = bisect_left(timestamps, cutoff_time_ms, self._head)
+
+        # Compact once the dead prefix outweighs the live points
+        if head > _HISTORY_COMPACT_MIN and head * 2 > len(timestamps):
+            del timestamps[:head]
+            del self._prices[:head]
+            head = 0
+        self._head = head
 
-    def get_momentum(self, window_seconds: float) -> Optional[MomentumStats]:
+    def get_momentum(
+        self,
+        window_seconds: float,
+        now_ms: Optional[float] = None,
+    ) -> MomentumStats:
         """Get momentum statistics for a specific time window.
 
         Parameters:
         -----------
         window_seconds : float
             Time window in seconds
+        now_ms : float, optional
+            Current wall-clock time in milliseconds (read here if None)
 
         Returns:
         --------
-        Optional[MomentumStats]
-            Momentum stats, or None if not enough data
+        MomentumStats
+            Momentum stats, or EMPTY_MOMENTUM if not enough data
         """
-        self._cleanup_old_prices()
+        if now_ms is None:
+            now_ms = time.time() * 1000
+        self._cleanup_old_prices(now_ms)
+        return self._momentum_for_window(window_seconds, now_ms)
 
-        if not self.price_history:
-            return None
+    def _momentum_for_window(
+        self,
+        window_seconds: float,
+        current_time_ms: float,
+    ) -> MomentumStats:
+        """Momentum for one window at ``current_time_ms`` (history already cleaned)."""
+        timestamps = self._timestamps_ms
+        head = self._head
+        if head == len(timestamps):
+            return EMPTY_MOMENTUM
 
-        current_time_ms = time.time() * 1000
         window_start_ms = current_time_ms - (window_seconds * 1000)
 
         # Find the first price point within the window
-        start_price = None
-        for point in self.price_history:
-            if point.timestamp_ms >= window_start_ms:
-                start_price = point.price
-                break
-
-        if start_price is None:
+        start = bisect_left(timestamps, window_start_ms, head)
+        if start == len(timestamps):
             # Not enough data for this window
-            return None
+            return EMPTY_MOMENTUM
+        start_price = self._prices[start]
 
         # Latest price is the last point
-        latest_point = self.price_history[-1]
-        latest_price = latest_point.price
-        latest_timestamp_ms = latest_point.timestamp_ms
+        latest_price = self._prices[-1]
+        latest_timestamp_ms = timestamps[-1]
 
         # Calculate percentage change
         if start_price != 0:
@@ -143,23 +213,23 @@ class PriceMomentumTracker:
         else:
             change_percent = 0.0
 
-        # Determine trend direction
-        if abs(change_percent) < self.flat_threshold_percent:
-            direction = "flat"
-        elif change_percent > 0:
-            direction = "up"
-        else:
-            direction = "down"
+        # Determine trend direction as a code, named via tuple lookup
+        direction_code = (
+            0 if abs(change_percent) < self.flat_threshold_percent
+            else 1 if change_percent > 0
+            else 2
+        )
 
         # Check if signal is usable (have we collected enough data?)
         # We want at least 50% of the window filled with data
-        oldest_in_window_ms = self.price_history[0].timestamp_ms
+        oldest_in_window_ms = timestamps[head]
         data_duration_ms = latest_timestamp_ms - oldest_in_window_ms
         is_usable = data_duration_ms >= (window_seconds * 1000 * 0.5)
 
         return MomentumStats(
             window_seconds=window_seconds,
-            direction=direction,
+            direction=_DIRECTIONS[direction_code],
+            direction_code=direction_code,
             change_percent=change_percent,
             latest_price=latest_price,
             start_price=start_price,
@@ -167,36 +237,51 @@ class PriceMomentumTracker:
             is_usable=is_usable,
         )
 
-    def get_short_momentum(self) -> Optional[MomentumStats]:
+    def get_short_momentum(self) -> MomentumStats:
         """Get short-term momentum statistics."""
         return self.get_momentum(self.short_window_seconds)
 
-    def get_long_momentum(self) -> Optional[MomentumStats]:
+    def get_long_momentum(self) -> MomentumStats:
         """Get long-term momentum statistics."""
         return self.get_momentum(self.long_window_seconds)
 
-    def get_all_momentum(self) -> tuple[Optional[MomentumStats], Optional[MomentumStats]]:
+    def get_all_momentum(
+        self,
+        now_ms: Optional[float] = None,
+    ) -> tuple[MomentumStats, MomentumStats]:
         """Get both short and long-term momentum statistics.
 
+        Parameters:
+        -----------
+        now_ms : float, optional
+            Current wall-clock time in milliseconds (read here if None)
+
         Returns:
         --------
-        tuple[Optional[MomentumStats], Optional[MomentumStats]]
+        tuple[MomentumStats, MomentumStats]
             (short_momentum, long_momentum)
         """
-        return (self.get_short_momentum(), self.get_long_momentum())
+        # One cleanup and one clock read shared by both windows
+        if now_ms is None:
+            now_ms = time.time() * 1000
+        self._cleanup_old_prices(now_ms)
+        return (
+            self._momentum_for_window(self.short_window_seconds, now_ms),
+            self._momentum_for_window(self.long_window_seconds, now_ms),
+        )
 
 
 def format_momentum_summary(
-    short: Optional[MomentumStats],
-    long: Optional[MomentumStats],
+    short: MomentumStats,
+    long: MomentumStats,
 ) -> str:
     """Format momentum stats as a readable summary.
 
     Parameters:
     -----------
-    short : Optional[MomentumStats]
+    short : MomentumStats
         Short-term momentum stats
-    long : Optional[MomentumStats]
+    long : MomentumStats
         Long-term momentum stats
 
     Returns:
@@ -208,15 +293,11 @@ def format_momentum_summary(
     lines.append("\nPrice Momentum")
     lines.append("=" * 60)
 
-    def format_stat(label: str, stat: Optional[MomentumStats]) -> str:
-        if stat is None:
+    def format_stat(label: str, stat: MomentumStats) -> str:
+        if stat is EMPTY_MOMENTUM:
             return f"{label:<15}: No data"
 
-        direction_symbol = {
-            "up": "↑",
-            "down": "↓",
-            "flat": "→",
-        }[stat.direction]
+        direction_symbol = _DIR_SYMBOLS[stat.direction_code]
 
         usable = "✓" if stat.is_usable else "✗"
 
@@ -227,16 +308,16 @@ def format_momentum_summary(
             f"[{usable}]"
         )
 
-    lines.append(format_stat(f"Short ({short.window_seconds if short else 0}s)", short))
-    lines.append(format_stat(f"Long ({long.window_seconds if long else 0}s)", long))
+    lines.append(format_stat(f"Short ({short.window_seconds}s)", short))
+    lines.append(format_stat(f"Long ({long.window_seconds}s)", long))
     lines.append("=" * 60)
 
     return "\n".join(lines)
 
 
 def detect_trend_alignment(
-    short: Optional[MomentumStats],
-    long: Optional[MomentumStats],
+    short: MomentumStats,
+    long: MomentumStats,
 ) -> Optional[str]:
     """Detect if short and long-term trends are aligned.
 
@@ -248,10 +329,7 @@ def detect_trend_alignment(
         "reversal_down" if short down but long up,
         None if no clear alignment
     """
-    if short is None or long is None:
-        return None
-
-    if not short.is_usable or not long.is_usable:
+    if not (short.is_usable and long.is_usable):
         return None
 
     # Both trending up
@@ -19,8 +19,18 @@ TrendRegime = Literal["up", "down", "range"]
 LiquidityRegime = Literal["high", "normal", "thin"]
 MarketRegime = Literal["normal", "trend", "chop", "liquidation_event", "short_squeeze", "crash"]
 
-
-@dataclass
+# Upper-case display names for every regime label, built once
+_REGIME_LABELS = {
+    label: label.upper()
+    for label in (
+        "up", "down", "range",
+        "high", "normal", "thin",
+        "trend", "chop", "liquidation_event", "short_squeeze", "crash",
+    )
+}
+
+
+@dataclass(frozen=True, slots=True)
 class RegimeDetection:
     """Complete regime detection result."""
 
@@ -92,17 +102,34 @@ class RegimeDetector:
         tuple[TrendRegime, float]
             (trend_regime, trend_strength)
         """
-        # Collect returns
-        returns = [ret_1m, ret_5m]
-        if ret_15m is not None:
-            returns.append(ret_15m)
+        # Scalar arithmetic over the two or three returns (no temporary
+        # list or generator passes)
+        trend_threshold = self.trend_threshold
+        positive_count = 0
+        negative_count = 0
+
+        if ret_1m > trend_threshold:
+            positive_count += 1
+        if ret_1m < -trend_threshold:
+            negative_count += 1
+        if ret_5m > trend_threshold:
+            positive_count += 1
+        if ret_5m < -trend_threshold:
+            negative_count += 1
+
+        if ret_15m is None:
+            n_returns = 2
+            total_return = ret_1m + ret_5m
+        else:
+            n_returns = 3
+            total_return = ret_1m + ret_5m + ret_15m
+            if ret_15m > trend_threshold:
+                positive_count += 1
+            if ret_15m < -trend_threshold:
+                negative_count += 1
 
         # Calculate average return
-        avg_return = sum(returns) / len(returns)
-
-        # Check if returns agree on direction
-        positive_count = sum(1 for r in returns if r > self.trend_threshold)
-        negative_count = sum(1 for r in returns if r < -self.trend_threshold)
+        avg_return = total_return / n_returns
 
         # Determine regime
         if abs(avg_return) < self.range_threshold:
@@ -118,7 +145,7 @@ class RegimeDetector:
         # Strength based on magnitude and alignment
         magnitude_strength = min(abs(avg_return) / self.strong_trend_threshold, 1.0)
 
-        alignment = max(positive_count, negative_count) / len(returns)
+        alignment = max(positive_count, negative_count) / n_returns
 
         strength = magnitude_strength * alignment
 
@@ -346,12 +373,12 @@ def format_regime_summary(regime: RegimeDetection) -> str:
     lines.append("\nMarket Regime Detection")
     lines.append("=" * 80)
 
-    lines.append(f"\nTrend Regime:      {regime.trend_regime.upper()}")
+    lines.append(f"\nTrend Regime:      {_REGIME_LABELS[regime.trend_regime]}")
     lines.append(f"Trend Strength:    {regime.trend_strength:.2f} / 1.00")
 
-    lines.append(f"\nLiquidity Regime:  {regime.liquidity_regime.upper()}")
+    lines.append(f"\nLiquidity Regime:  {_REGIME_LABELS[regime.liquidity_regime]}")
 
-    lines.append(f"\nMarket Regime:     {regime.market_regime.upper()}")
+    lines.append(f"\nMarket Regime:     {_REGIME_LABELS[regime.market_regime]}")
 
     lines.append("=" * 80)
 
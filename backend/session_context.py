@@ -14,21 +14,17 @@ within the trading session/day.
 from __future__ import annotations
 
 import time
-from collections import deque
+from bisect import bisect_left
 from dataclasses import dataclass
 from typing import Optional, Tuple
-import statistics
 
 
-@dataclass
-class Trade:
-    """A single trade for VWAP calculation."""
-    timestamp_ms: float
-    price: float
-    size_usd: float
+# Expired trades are compacted out of the history columns once at least
+# this many have accumulated ahead of the live head
+_TRADE_COMPACT_MIN = 1024
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionContext:
     """Session/daily market context."""
     # Daily extremes
@@ -90,8 +86,14 @@ class SessionContextTracker:
         self.daily_low: Optional[float] = None
         self.current_price: Optional[float] = None
 
-        # Trade history for VWAP and volume
-        self.trades: deque[Trade] = deque()
+        # Trade history for VWAP and volume, as parallel columns in arrival
+        # order: timestamp plus inclusive prefix sums of notional and USD
+        # size, so any window sum is a bisect and a subtraction. Expiry
+        # advances a head offset; the dead prefix is compacted in bulk.
+        self._trade_ts: list[float] = []
+        self._notional_cum: list[float] = []
+        self._size_cum: list[float] = []
+        self._head = 0
 
     def reset_session(self, timestamp_ms: float, starting_price: float) -> None:
         """Reset session (e.g., at day boundary or manually)."""
@@ -121,8 +123,15 @@ class SessionContextTracker:
         self.current_price = price
 
         # Store trade
-        trade = Trade(timestamp_ms=timestamp_ms, price=price, size_usd=size_usd)
-        self.trades.append(trade)
+        notional_cum = self._notional_cum
+        size_cum = self._size_cum
+        if notional_cum:
+            notional_cum.append(notional_cum[-1] + price * size_usd)
+            size_cum.append(size_cum[-1] + size_usd)
+        else:
+            notional_cum.append(price * size_usd)
+            size_cum.append(size_usd)
+        self._trade_ts.append(timestamp_ms)
 
         # Cleanup old trades
         self._cleanup_old_trades(timestamp_ms)
@@ -142,26 +151,41 @@ class SessionContextTracker:
 
     def _cleanup_old_trades(self, current_time_ms: float) -> None:
         """Remove trades outside VWAP window."""
-        if not self.trades:
+        trade_ts = self._trade_ts
+        if self._head == len(trade_ts):
             return
 
         # Keep trades within VWAP window
         cutoff_ms = current_time_ms - (self.vwap_window_hours * 3600 * 1000)
+        head = bisect_left(trade_ts, cutoff_ms, self._head)
+
+        # Compact once the dead prefix outweighs the live trades, rebasing
+        # the prefix sums so they start from zero again
+        if head > _TRADE_COMPACT_MIN and head * 2 > len(trade_ts):
+            notional_base = self._notional_cum[head - 1]
+            size_base = self._size_cum[head - 1]
+            del trade_ts[:head]
+            self._notional_cum = [c - notional_base for c in self._notional_cum[head:]]
+            self._size_cum = [c - size_base for c in self._size_cum[head:]]
+            head = 0
+        self._head = head
+
+    def _sums_since(self, index: int) -> Tuple[float, float]:
+        """(notional, USD volume) of live trades from ``index`` to the newest."""
+        notional_cum = self._notional_cum
+        size_cum = self._size_cum
+        if index == len(size_cum):
+            return 0.0, 0.0
+        if index == 0:
+            return notional_cum[-1], size_cum[-1]
+        return (
+            notional_cum[-1] - notional_cum[index - 1],
+            size_cum[-1] - size_cum[index - 1],
+        )
 
-        while self.trades and self.trades[0].timestamp_ms < cutoff_ms:
-            self.trades.popleft()
-
-    def _calculate_vwap(self, trades: list[Trade]) -> Optional[float]:
-        """Calculate VWAP from trades."""
-        if not trades:
-            return None
-
-        total_notional = 0.0
-        total_volume = 0.0
-
-        for trade in trades:
-            total_notional += trade.price * trade.size_usd
-            total_volume += trade.size_usd
+    def _calculate_vwap(self) -> Optional[float]:
+        """Calculate VWAP over the retained trades."""
+        total_notional, total_volume = self._sums_since(self._head)
 
         if total_volume == 0:
             return None
@@ -170,18 +194,22 @@ class SessionContextTracker:
 
     def _calculate_volume_for_window(
         self,
-        trades: list[Trade],
         window_hours: float,
         current_time_ms: float
     ) -> float:
         """Calculate volume for a specific time window."""
         cutoff_ms = current_time_ms - (window_hours * 3600 * 1000)
-        volume = sum(t.size_usd for t in trades if t.timestamp_ms >= cutoff_ms)
-        return volume
+        start = bisect_left(self._trade_ts, cutoff_ms, self._head)
+        return self._sums_since(start)[1]
 
-    def get_context(self) -> Optional[SessionContext]:
+    def get_context(self, now_ms: Optional[float] = None) -> Optional[SessionContext]:
         """Get current session context.
 
+        Parameters:
+        -----------
+        now_ms : float, optional
+            Current wall-clock time in milliseconds (read here if None)
+
         Returns:
         --------
         Optional[SessionContext]
@@ -193,15 +221,19 @@ class SessionContextTracker:
         if self.session_start_ms is None:
             return None
 
-        current_time_ms = time.time() * 1000
+        current_time_ms = now_ms if now_ms is not None else time.time() * 1000
 
         # Calculate position in range
         price_range = self.daily_high - self.daily_low
 
         if price_range > 0:
-            pct_from_low = ((self.current_price - self.daily_low) / self.daily_low) * 100
-            pct_from_high = ((self.daily_high - self.current_price) / self.daily_high) * 100
-            pct_through_range = ((self.current_price - self.daily_low) / price_range) * 100
+            current_price = self.current_price
+            daily_low = self.daily_low
+            daily_high = self.daily_high
+            # A zero low (bad print) would otherwise divide by zero here
+            pct_from_low = ((current_price - daily_low) / daily_low) * 100 if daily_low else 0.0
+            pct_from_high = ((daily_high - current_price) / daily_high) * 100
+            pct_through_range = ((current_price - daily_low) / price_range) * 100
         else:
             # Price hasn't moved
             pct_from_low = 0.0
@@ -209,16 +241,16 @@ class SessionContextTracker:
             pct_through_range = 50.0  # Middle
 
         # Calculate VWAP
-        session_vwap = self._calculate_vwap(list(self.trades))
+        session_vwap = self._calculate_vwap()
         if session_vwap is None:
             session_vwap = self.current_price  # Fallback
 
         distance_from_vwap_bps = ((self.current_price - session_vwap) / session_vwap) * 10000
 
         # Calculate volumes
-        session_volume_usd = sum(t.size_usd for t in self.trades)
-        last_1h_volume = self._calculate_volume_for_window(list(self.trades), 1.0, current_time_ms)
-        last_4h_volume = self._calculate_volume_for_window(list(self.trades), 4.0, current_time_ms)
+        session_volume_usd = self._sums_since(self._head)[1]
+        last_1h_volume = self._calculate_volume_for_window(1.0, current_time_ms)
+        last_4h_volume = self._calculate_volume_for_window(4.0, current_time_ms)
 
         # Session duration
         session_duration_hours = (current_time_ms - self.session_start_ms) / (1000 * 3600)
@@ -240,6 +272,28 @@ class SessionContextTracker:
         )
 
 
+# Summary layout for format_session_context, filled from one SessionContext
+_SESSION_TEMPLATE = "\n".join([
+    "\nSession/Daily Context",
+    "=" * 80,
+    "\nPrice Action:",
+    "  Current Price:    ${ctx.current_price:,.2f}",
+    "  Daily High:       ${ctx.daily_high:,.2f}  ({ctx.pct_from_high:+.2f}% away)",
+    "  Daily Low:        ${ctx.daily_low:,.2f}  ({ctx.pct_from_low:+.2f}% away)",
+    "  Through Range:    {ctx.pct_through_range:.1f}%",
+    "\nVWAP:",
+    "  Session VWAP:     ${ctx.session_vwap:,.2f}",
+    "  Distance:         {ctx.distance_from_vwap_bps:+.1f} bps",
+    "\nVolume:",
+    "  Session Volume:   ${ctx.session_volume_usd:,.0f}",
+    "  Last 1h:          ${ctx.last_1h_volume_usd:,.0f}",
+    "  Last 4h:          ${ctx.last_4h_volume_usd:,.0f}",
+    "\nSession Info:",
+    "  Duration:         {ctx.session_duration_hours:.1f} hours",
+    "=" * 80,
+])
+
+
 def format_session_context(ctx: SessionContext) -> str:
     """Format session context as readable summary.
 
@@ -253,28 +307,4 @@ def format_session_context(ctx: SessionContext) -> str:
     str
         Formatted summary
     """
-    lines = []
-    lines.append("\nSession/Daily Context")
-    lines.append("=" * 80)
-
-    lines.append(f"\nPrice Action:")
-    lines.append(f"  Current Price:    ${ctx.current_price:,.2f}")
-    lines.append(f"  Daily High:       ${ctx.daily_high:,.2f}  ({ctx.pct_from_high:+.2f}% away)")
-    lines.append(f"  Daily Low:        ${ctx.daily_low:,.2f}  ({ctx.pct_from_low:+.2f}% away)")
-    lines.append(f"  Through Range:    {ctx.pct_through_range:.1f}%")
-
-    lines.append(f"\nVWAP:")
-    lines.append(f"  Session VWAP:     ${ctx.session_vwap:,.2f}")
-    lines.append(f"  Distance:         {ctx.distance_from_vwap_bps:+.1f} bps")
-
-    lines.append(f"\nVolume:")
-    lines.append(f"  Session Volume:   ${ctx.session_volume_usd:,.0f}")
-    lines.append(f"  Last 1h:          ${ctx.last_1h_volume_usd:,.0f}")
-    lines.append(f"  Last 4h:          ${ctx.last_4h_volume_usd:,.0f}")
-
-    lines.append(f"\nSession Info:")
-    lines.append(f"  Duration:         {ctx.session_duration_hours:.1f} hours")
-
-    lines.append("=" * 80)
-
-    return "\n".join(lines)
+    return _SESSION_TEMPLATE.format(ctx=ctx)
@@ -9,11 +9,12 @@ M (expected profit) > 2 × cost (spread + slippage + fees).
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple, Union
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OrderBookLevel:
     """Single orderbook level."""
     price: float
@@ -21,7 +22,7 @@ class OrderBookLevel:
     total_usd: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SlippageEstimate:
     """Slippage estimate for a specific trade size."""
     trade_size_usd: float
@@ -42,6 +43,89 @@ class SlippageEstimate:
     liquidity_used_pct: float  # % of available liquidity used
 
 
+@dataclass(frozen=True, slots=True)
+class OrderBookColumns:
+    """One side of the orderbook as parallel columns (sorted best to worst).
+
+    Built once per snapshot. Inclusive prefix sums of USD size and notional
+    turn each fill into a binary search for the level that completes it.
+    Columns are tuples, so a built side cannot change under a cached result.
+    """
+    prices: Tuple[float, ...]
+    cum_usd: Tuple[float, ...]  # USD liquidity through each level
+    cum_notional: Tuple[float, ...]  # Sum of price * USD size through each level
+    total_liquidity_usd: float
+
+    @classmethod
+    def from_levels(cls, levels: List[OrderBookLevel]) -> "OrderBookColumns":
+        """Build columns from a list of levels."""
+        return cls.from_pairs((level.price, level.total_usd) for level in levels)
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[Tuple[float, float]]) -> "OrderBookColumns":
+        """Build columns from (price, total_usd) pairs, best to worst.
+
+        Lets callers that already hold book data fill the columns directly
+        without creating an OrderBookLevel per level.
+        """
+        prices = []
+        cum_usd = []
+        cum_notional = []
+        running_usd = 0.0
+        running_notional = 0.0
+        for price, total_usd in pairs:
+            running_usd += total_usd
+            running_notional += total_usd * price
+            prices.append(price)
+            cum_usd.append(running_usd)
+            cum_notional.append(running_notional)
+
+        return cls(
+            prices=tuple(prices),
+            cum_usd=tuple(cum_usd),
+            cum_notional=tuple(cum_notional),
+            total_liquidity_usd=running_usd,
+        )
+
+
+BookSide = Union[List[OrderBookLevel], OrderBookColumns]
+
+
+def _as_columns(book: BookSide) -> OrderBookColumns:
+    """Accept either a level list or prebuilt columns."""
+    if isinstance(book, OrderBookColumns):
+        return book
+    return OrderBookColumns.from_levels(book)
+
+
+def _walk_book(
+    book: OrderBookColumns,
+    trade_size_usd: float,
+) -> tuple[float, float]:
+    """Fill ``trade_size_usd`` against levels (best to worst).
+
+    Returns (total_usd_filled, total_notional).
+    """
+    cum_usd = book.cum_usd
+
+    # First level whose cumulative liquidity covers the order
+    idx = bisect_left(cum_usd, trade_size_usd)
+    if idx == len(cum_usd):
+        # Not enough liquidity: the whole side is consumed
+        return (cum_usd[-1], book.cum_notional[-1]) if cum_usd else (0.0, 0.0)
+
+    # Levels before idx fill fully, the remainder comes from level idx
+    if idx:
+        filled_usd = cum_usd[idx - 1]
+        notional = book.cum_notional[idx - 1]
+    else:
+        filled_usd = 0.0
+        notional = 0.0
+    remaining_usd = trade_size_usd - filled_usd
+
+    return filled_usd + remaining_usd, notional + remaining_usd * book.prices[idx]
+
+
 class SlippageEstimator:
     """Estimates slippage and execution costs from orderbook."""
 
@@ -58,9 +142,16 @@ class SlippageEstimator:
         """
         self.taker_fee_bps = taker_fee_bps
 
+        # Last (bid columns, ask columns, request params, results) from
+        # estimate_for_sizes. Columns are immutable, so a repeat query for the
+        # same book (e.g. polls between book updates) reuses the results.
+        self._last_estimates: Optional[
+            Tuple[OrderBookColumns, OrderBookColumns, tuple, dict]
+        ] = None
+
     def estimate_buy(
         self,
-        asks: List[OrderBookLevel],
+        asks: BookSide,
         trade_size_usd: float,
         best_ask: float,
         spread_bps: float,
@@ -69,7 +160,7 @@ class SlippageEstimator:
 
         Parameters
         ----------
-        asks : List[OrderBookLevel]
+        asks : List[OrderBookLevel] or OrderBookColumns
             Ask side of orderbook (sorted best to worst)
         trade_size_usd : float
             Trade size in USD
@@ -83,24 +174,13 @@ class SlippageEstimator:
         SlippageEstimate
             Slippage estimate for this buy
         """
-        if not asks or trade_size_usd <= 0:
+        asks = _as_columns(asks)
+        if not asks.prices or trade_size_usd <= 0:
             return self._empty_estimate(trade_size_usd, "buy", best_ask, spread_bps)
 
         # Walk through asks to fill the order
-        total_usd_filled = 0.0
-        total_notional = 0.0
-        total_liquidity_usd = sum(level.total_usd for level in asks)
-
-        for level in asks:
-            if total_usd_filled >= trade_size_usd:
-                break
-
-            # How much can we fill at this level?
-            remaining_usd = trade_size_usd - total_usd_filled
-            fill_usd = min(remaining_usd, level.total_usd)
-
-            total_usd_filled += fill_usd
-            total_notional += fill_usd * level.price
+        total_usd_filled, total_notional = _walk_book(asks, trade_size_usd)
+        total_liquidity_usd = asks.total_liquidity_usd
 
         # Check if feasible
         is_feasible = total_usd_filled >= trade_size_usd * 0.99  # Allow 1% shortfall
@@ -132,7 +212,7 @@ class SlippageEstimator:
 
     def estimate_sell(
         self,
-        bids: List[OrderBookLevel],
+        bids: BookSide,
         trade_size_usd: float,
         best_bid: float,
         spread_bps: float,
@@ -141,7 +221,7 @@ class SlippageEstimator:
 
         Parameters
         ----------
-        bids : List[OrderBookLevel]
+        bids : List[OrderBookLevel] or OrderBookColumns
             Bid side of orderbook (sorted best to worst)
         trade_size_usd : float
             Trade size in USD
@@ -155,24 +235,13 @@ class SlippageEstimator:
         SlippageEstimate
             Slippage estimate for this sell
         """
-        if not bids or trade_size_usd <= 0:
+        bids = _as_columns(bids)
+        if not bids.prices or trade_size_usd <= 0:
             return self._empty_estimate(trade_size_usd, "sell", best_bid, spread_bps)
 
         # Walk through bids to fill the order
-        total_usd_filled = 0.0
-        total_notional = 0.0
-        total_liquidity_usd = sum(level.total_usd for level in bids)
-
-        for level in bids:
-            if total_usd_filled >= trade_size_usd:
-                break
-
-            # How much can we fill at this level?
-            remaining_usd = trade_size_usd - total_usd_filled
-            fill_usd = min(remaining_usd, level.total_usd)
-
-            total_usd_filled += fill_usd
-            total_notional += fill_usd * level.price
+        total_usd_filled, total_notional = _walk_book(bids, trade_size_usd)
+        total_liquidity_usd = bids.total_liquidity_usd
 
         # Check if feasible
         is_feasible = total_usd_filled >= trade_size_usd * 0.99  # Allow 1% shortfall
@@ -204,8 +273,8 @@ class SlippageEstimator:
 
     def estimate_for_sizes(
         self,
-        bids: List[OrderBookLevel],
-        asks: List[OrderBookLevel],
+        bids: BookSide,
+        asks: BookSide,
         trade_sizes_usd: List[float],
         best_bid: float,
         best_ask: float,
@@ -215,9 +284,9 @@ class SlippageEstimator:
 
         Parameters
         ----------
-        bids : List[OrderBookLevel]
+        bids : List[OrderBookLevel] or OrderBookColumns
             Bid side of orderbook
-        asks : List[OrderBookLevel]
+        asks : List[OrderBookLevel] or OrderBookColumns
             Ask side of orderbook
         trade_sizes_usd : List[float]
             Trade sizes to estimate (e.g., [500, 1000, 5000])
@@ -233,24 +302,42 @@ class SlippageEstimator:
         dict[str, dict[str, SlippageEstimate]]
             Nested dict: {size_label: {"buy": estimate, "sell": estimate}}
         """
-        results = {}
-
-        for size_usd in trade_sizes_usd:
-            # Format size label
-            if size_usd >= 1000:
-                size_label = f"${int(size_usd/1000)}k"
-            else:
-                size_label = f"${int(size_usd)}"
-
-            buy_est = self.estimate_buy(asks, size_usd, best_ask, spread_bps)
-            sell_est = self.estimate_sell(bids, size_usd, best_bid, spread_bps)
-
-            results[size_label] = {
-                "buy": buy_est,
-                "sell": sell_est,
-            }
-
-        return results
+        # Build each side's columns (and total liquidity) once per call
+        # rather than once per trade size
+        bids = _as_columns(bids)
+        asks = _as_columns(asks)
+
+        params = (tuple(trade_sizes_usd), best_bid, best_ask, spread_bps)
+        cached = self._last_estimates
+        if (
+            cached is not None
+            and cached[2] == params
+            and (cached[0] is bids or cached[0] == bids)
+            and (cached[1] is asks or cached[1] == asks)
+        ):
+            results = cached[3]
+        else:
+            results = {}
+
+            for size_usd in trade_sizes_usd:
+                # Format size label
+                if size_usd >= 1000:
+                    size_label = f"${int(size_usd/1000)}k"
+                else:
+                    size_label = f"${int(size_usd)}"
+
+                buy_est = self.estimate_buy(asks, size_usd, best_ask, spread_bps)
+                sell_est = self.estimate_sell(bids, size_usd, best_bid, spread_bps)
+
+                results[size_label] = {
+                    "buy": buy_est,
+                    "sell": sell_est,
+                }
+
+            self._last_estimates = (bids, asks, params, results)
+
+        # Hand out copies so callers can't alter the cached results
+        return {size_label: dict(sides) for size_label, sides in results.items()}
 
     def _empty_estimate(
         self,
@@ -274,6 +361,16 @@ class SlippageEstimator:
         )
 
 
+# Two summary lines per side of one trade size, filled from a SlippageEstimate
+_ESTIMATE_TEMPLATE = (
+    "  {label} VWAP ${est.avg_fill_price:.2f}  |  "
+    "Slippage: {est.slippage_bps:.1f} bps  |  "
+    "Round-trip: {est.round_trip_cost_bps:.1f} bps\n"
+    "        Liquidity Used: {est.liquidity_used_pct:.1f}%  |  "
+    "Feasible: {est.is_feasible}"
+)
+
+
 def format_slippage_summary(estimates: dict[str, dict[str, SlippageEstimate]]) -> str:
     """Format slippage estimates as readable summary.
 
@@ -298,17 +395,8 @@ def format_slippage_summary(estimates: dict[str, dict[str, SlippageEstimate]]) -
         buy_est = size_estimates["buy"]
         sell_est = size_estimates["sell"]
 
-        lines.append(f"  BUY:  VWAP ${buy_est.avg_fill_price:.2f}  |  "
-                    f"Slippage: {buy_est.slippage_bps:.1f} bps  |  "
-                    f"Round-trip: {buy_est.round_trip_cost_bps:.1f} bps")
-        lines.append(f"        Liquidity Used: {buy_est.liquidity_used_pct:.1f}%  |  "
-                    f"Feasible: {buy_est.is_feasible}")
-
-        lines.append(f"  SELL: VWAP ${sell_est.avg_fill_price:.2f}  |  "
-                    f"Slippage: {sell_est.slippage_bps:.1f} bps  |  "
-                    f"Round-trip: {sell_est.round_trip_cost_bps:.1f} bps")
-        lines.append(f"        Liquidity Used: {sell_est.liquidity_used_pct:.1f}%  |  "
-                    f"Feasible: {sell_est.is_feasible}")
+        lines.append(_ESTIMATE_TEMPLATE.format(label="BUY: ", est=buy_est))
+        lines.append(_ESTIMATE_TEMPLATE.format(label="SELL:", est=sell_est))
 
     lines.append("=" * 80)
 
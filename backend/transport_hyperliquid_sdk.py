@@ -17,7 +17,7 @@ configured in :class:`backend.config.SubscriptionConfig`.
 
 from __future__ import annotations
 
-from queue import Queue
+from queue import Empty, SimpleQueue
 from threading import Event
 from typing import Any, Callable, Iterable, Mapping, Optional
 
@@ -63,7 +63,10 @@ class HyperliquidSdkTransport(HyperliquidTransport):
     def __init__(self, info_factory: Optional[InfoFactory] = None) -> None:
         self._info_factory: InfoFactory = info_factory or _default_info_factory
         self._info: Any = None
-        self._queue: Queue[Mapping[str, Any]] = Queue()
+        # SimpleQueue is a C-implemented unbounded FIFO: no maxsize or
+        # task_done bookkeeping (unused here) and no condition variables on
+        # the put/get path
+        self._queue: SimpleQueue[Mapping[str, Any]] = SimpleQueue()
         self._closed = False
         self._stop_event = Event()
         self._sentinel: Mapping[str, Any] = {"_sentinel": True}
@@ -89,13 +92,24 @@ class HyperliquidSdkTransport(HyperliquidTransport):
         else:
             subs = []
 
-        def make_callback() -> Callable[[Mapping[str, Any]], None]:
-            def callback(message: Mapping[str, Any]) -> None:
-                if self._closed or self._stop_event.is_set():
-                    return
-                normalized = self._normalize_ws_message(message)
-                if normalized is not None:
-                    self._queue.put(normalized)
+        put = self._queue.put
+        stop_event = self._stop_event
+
+        def make_callback(sub: Mapping[str, Any]) -> Callable[[Mapping[str, Any]], None]:
+            # Only candle messages need normalizing, so pick the callback once
+            # per subscription instead of checking the channel per message.
+            if sub.get("type") == "candle":
+                def callback(message: Mapping[str, Any]) -> None:
+                    if self._closed or stop_event.is_set():
+                        return
+                    normalized = self._normalize_ws_message(message)
+                    if normalized is not None:
+                        put(normalized)
+            else:
+                def callback(message: Mapping[str, Any]) -> None:
+                    if self._closed or stop_event.is_set():
+                        return
+                    put(message)
 
             return callback
 
@@ -103,15 +117,27 @@ class HyperliquidSdkTransport(HyperliquidTransport):
         # incoming messages to the appropriate callback on its internal
         # WebSocket thread.
         for sub in subs:
-            info.subscribe(sub, make_callback())
+            info.subscribe(sub, make_callback(sub))
 
-        # Now yield messages from the queue until closed.
+        # Now yield messages from the queue until closed. Block for the first
+        # message of a burst, then drain the rest without blocking.
+        queue = self._queue
+        sentinel = self._sentinel
         try:
             while not self._closed and not self._stop_event.is_set():
-                message = self._queue.get()
-                if message is self._sentinel:
+                message = queue.get()
+                if message is sentinel:
                     break
                 yield message
+
+                while not self._closed:
+                    try:
+                        message = queue.get_nowait()
+                    except Empty:
+                        break
+                    if message is sentinel:
+                        return
+                    yield message
         finally:
             # Ensure underlying resources are cleaned up if the consumer stops
             # iterating without calling close() explicitly.
@@ -0,0 +1,58 @@
+"""Tests for backend.crowding_detector."""
+
+from backend.crowding_detector import BasisStatus, CrowdingDetector
+
+
+def test_crowded_long_interpretation_text():
+    crowding = CrowdingDetector().detect(
+        oi_trend="up",
+        oi_velocity=0.1,
+        funding_rate=0.03,
+        funding_trend="up",
+        basis_percent=0.2,
+        basis_status="Premium",
+    )
+
+    assert crowding.interpretation == (
+        "Crowded LONG (score: 1.10): High OI up, positive funding, perp Premium. "
+        "Risk of long liquidations if price drops."
+    )
+
+
+def test_crowded_short_interpretation_text():
+    crowding = CrowdingDetector().detect(
+        oi_trend="up",
+        oi_velocity=0.1,
+        funding_rate=-0.03,
+        funding_trend="down",
+        basis_percent=-0.2,
+        basis_status="Discount",
+    )
+
+    assert crowding.interpretation == (
+        "Crowded SHORT (score: 1.10): High OI up, negative funding, perp Discount. "
+        "Risk of short squeeze if price rises."
+    )
+
+
+def test_basis_labels_match_market_indicator_statuses():
+    for status in ("Premium", "Normal", "Discount"):
+        assert BasisStatus.parse(status).label == status
+
+
+def test_reading_interpretation_keeps_equality():
+    detector = CrowdingDetector()
+    args = dict(
+        oi_trend="up",
+        oi_velocity=0.1,
+        funding_rate=0.03,
+        funding_trend="up",
+        basis_percent=0.2,
+        basis_status="Premium",
+    )
+    first = detector.detect(**args)
+    second = detector.detect(**args)
+
+    assert first == second
+    first.interpretation
+    assert first == second
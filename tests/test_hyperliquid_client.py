@@ -0,0 +1,69 @@
+"""Tests for backend.hyperliquid_client."""
+
+from backend.hyperliquid_client import HyperliquidMessageParser, _EventRing
+from backend.models import OrderBookLevel, OrderBookSnapshot
+
+
+def parse_book(bids, asks):
+    parser = HyperliquidMessageParser(coin="BTC")
+    events = parser.parse_message(
+        {
+            "channel": "l2Book",
+            "data": {"coin": "BTC", "time": 1_000, "levels": [bids, asks]},
+        }
+    )
+    assert len(events) == 1
+    assert isinstance(events[0], OrderBookSnapshot)
+    return events[0]
+
+
+def test_compact_and_dict_levels():
+    book = parse_book(
+        [["100.5", "2.0", 3], ["100.0", "1.5", 1]],
+        [{"px": "101.0", "sz": "0.5", "n": 2}],
+    )
+
+    assert book.bids == [OrderBookLevel(100.5, 2.0, 3), OrderBookLevel(100.0, 1.5, 1)]
+    assert book.asks == [OrderBookLevel(101.0, 0.5, 2)]
+
+
+def test_malformed_trailing_level_is_skipped():
+    book = parse_book(
+        [["100.5", "2.0", 3], ["bad", "1.0", 1]],
+        [{"px": "101.0", "sz": "0.5", "n": 2}, ["102.0"]],
+    )
+
+    assert book.bids == [OrderBookLevel(100.5, 2.0, 3)]
+    assert book.asks == [OrderBookLevel(101.0, 0.5, 2)]
+
+
+def test_mixed_level_shapes_are_parsed_per_level():
+    book = parse_book(
+        [["100.5", "2.0", 3], {"px": "100.0", "sz": "1.5", "n": 1}, None],
+        [{"px": "101.0", "sz": "0.5", "n": 2}, ["102.0", "4.0", 5]],
+    )
+
+    assert book.bids == [OrderBookLevel(100.5, 2.0, 3), OrderBookLevel(100.0, 1.5, 1)]
+    assert book.asks == [OrderBookLevel(101.0, 0.5, 2), OrderBookLevel(102.0, 4.0, 5)]
+
+
+def test_event_ring_wraps_and_grows_in_fifo_order():
+    ring = _EventRing(capacity=4)
+    pushed = 0
+    popped = []
+
+    # Interleave pushes and pops so the head wraps, then outpace the pops
+    # so the ring has to grow while wrapped
+    for burst in (3, 3, 6, 9, 2):
+        for _ in range(burst):
+            ring.push(pushed)
+            pushed += 1
+        for _ in range(2):
+            popped.append(ring.pop())
+
+    while len(ring):
+        popped.append(ring.pop())
+
+    assert popped == list(range(pushed))
+    assert ring.pop() is None
+    assert len(ring._slots) == 16
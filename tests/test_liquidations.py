@@ -0,0 +1,92 @@
+"""Tests for backend.liquidations."""
+
+import random
+
+from backend.liquidations import LiquidationReason, LiquidationsDetector
+
+
+def test_cascade_includes_trade_exactly_at_window_start():
+    detector = LiquidationsDetector(cascade_time_window_ms=5000.0)
+    for ts in (0.0, 1000.0, 2000.0, 3000.0):
+        assert detector.add_trade(ts, 100.0, 3000.0, "sell") is None
+
+    liquidation = detector.add_trade(5000.0, 99.0, 3000.0, "sell")
+
+    assert liquidation is not None
+    assert liquidation.reason_code is LiquidationReason.CASCADE
+    assert liquidation.side == "long"
+    assert liquidation.total_volume_usd == 15000.0
+
+
+def test_cascade_excludes_trade_just_before_window_start():
+    detector = LiquidationsDetector(cascade_time_window_ms=5000.0)
+    for ts in (-1.0, 1000.0, 2000.0, 3000.0):
+        detector.add_trade(ts, 100.0, 3000.0, "sell")
+
+    assert detector.add_trade(5000.0, 99.0, 3000.0, "sell") is None
+
+
+def test_stats_across_liquidation_eviction_and_rebase():
+    detector = LiquidationsDetector(max_history_seconds=900.0)
+    detector.add_trade(0.0, 100.0, 20000.0, "sell")  # long, evicted below
+    detector.add_trade(1000.0, 100.0, 30000.0, "buy")  # short, kept
+    detector.add_trade(901_000.0, 100.0, 50000.0, "sell")  # long
+
+    full = detector.get_stats(900.0)
+    assert len(detector.suspected_liquidations) == 2
+    assert (full.long_liquidations, full.short_liquidations) == (1, 1)
+    assert full.total_long_volume_usd == 50000.0
+    assert full.total_short_volume_usd == 30000.0
+
+    recent = detector.get_stats(60.0)
+    assert (recent.long_liquidations, recent.short_liquidations) == (1, 0)
+    assert recent.total_long_volume_usd == 50000.0
+    assert recent.total_short_volume_usd == 0.0
+    assert recent.last_liquidation.timestamp_ms == 901_000.0
+
+
+def test_stats_and_cascades_after_compacting_expired_trades():
+    detector = LiquidationsDetector(cascade_time_window_ms=5000.0)
+    for i in range(300):
+        detector.add_trade(i * 10.0, 100.0, 10.0, "buy" if i % 2 else "sell")
+
+    # Far enough ahead that all 300 trades expire and get compacted out
+    detector.add_trade(20_000.0, 100.0, 20000.0, "sell")
+    assert len(detector._trade_ts) < 300
+
+    for ts in (20_001.0, 20_002.0, 20_003.0):
+        assert detector.add_trade(ts, 100.0, 3000.0, "sell") is None
+    cascade = detector.add_trade(20_004.0, 100.0, 3000.0, "sell")
+
+    assert cascade is not None
+    assert cascade.total_volume_usd == 32000.0
+
+    stats = detector.get_stats(60.0)
+    assert (stats.long_liquidations, stats.short_liquidations) == (2, 0)
+    assert stats.total_long_volume_usd == 52000.0
+    assert stats.status == "Normal"
+
+
+def test_add_trades_matches_repeated_add_trade():
+    rng = random.Random(7)
+    trades = []
+    ts = 0.0
+    for _ in range(2000):
+        ts += rng.choice([1.0, 50.0, 400.0, 3000.0, 60_000.0])
+        size = rng.choice([500.0, 2500.0, 4000.0, 12000.0, 60000.0])
+        trades.append((ts, 100.0 + rng.random(), size, rng.choice(["buy", "sell"])))
+
+    one_by_one = LiquidationsDetector()
+    expected = [
+        liquidation
+        for liquidation in (one_by_one.add_trade(*trade) for trade in trades)
+        if liquidation is not None
+    ]
+
+    batched = LiquidationsDetector()
+    actual = []
+    for start in range(0, len(trades), 137):
+        actual.extend(batched.add_trades(trades[start:start + 137]))
+
+    assert actual == expected
+    assert batched.get_multi_timeframe_stats() == one_by_one.get_multi_timeframe_stats()
@@ -0,0 +1,48 @@
+"""Tests for backend.orderbook_metrics."""
+
+import dataclasses
+
+import pytest
+
+from backend.orderbook_metrics import (
+    OrderBook,
+    OrderBookLevel,
+    OrderBookSide,
+    calculate_all_metrics,
+)
+
+
+def make_book(bid: float = 99.0, ask: float = 101.0) -> OrderBook:
+    return OrderBook(
+        bids=OrderBookSide(levels=[OrderBookLevel(bid, 2.0), OrderBookLevel(bid - 1, 3.0)]),
+        asks=OrderBookSide(levels=[OrderBookLevel(ask, 1.0), OrderBookLevel(ask + 1, 4.0)]),
+        timestamp_ms=1_000.0,
+    )
+
+
+def test_derived_prices():
+    book = make_book()
+
+    assert book.best_bid == 99.0
+    assert book.best_ask == 101.0
+    assert book.mid_price == 100.0
+    assert book.spread_absolute == 2.0
+    assert book.spread_bps == 200.0
+
+
+def test_sides_cannot_be_reassigned():
+    book = make_book()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        book.bids = OrderBookSide(levels=[])
+
+
+def test_calculate_all_metrics_does_not_share_results_between_calls():
+    book = make_book()
+
+    first = calculate_all_metrics(book, trade_sizes_usd=[100.0])
+    first.depth_by_level.clear()
+    second = calculate_all_metrics(book, trade_sizes_usd=[100.0])
+
+    assert second is not first
+    assert len(second.depth_by_level) == 2
@@ -0,0 +1,74 @@
+"""Tests for backend.price_momentum."""
+
+from backend.price_momentum import EMPTY_MOMENTUM, PriceMomentumTracker
+
+
+def feed(tracker, points):
+    for ts, price in points:
+        tracker.add_price(price, timestamp_ms=ts, now_ms=ts)
+
+
+def test_window_starts_at_first_point_inside_window():
+    tracker = PriceMomentumTracker()
+    feed(tracker, [(i * 1000.0, 100.0 + i) for i in range(11)])
+
+    # A point exactly on the window start is included
+    stats = tracker.get_momentum(5.0, now_ms=10_000.0)
+    assert stats.start_price == 105.0
+    assert stats.latest_price == 110.0
+    assert stats.direction == "up"
+    assert stats.direction_code == 1
+
+    stats = tracker.get_momentum(5.0, now_ms=10_500.0)
+    assert stats.start_price == 106.0
+
+
+def test_empty_and_stale_history_return_empty_momentum():
+    tracker = PriceMomentumTracker()
+    assert tracker.get_momentum(5.0, now_ms=1_000.0) is EMPTY_MOMENTUM
+
+    feed(tracker, [(0.0, 100.0), (1_000.0, 101.0)])
+
+    # Still retained for the long window, but nothing in the short one
+    assert tracker.get_momentum(5.0, now_ms=7_000.0) is EMPTY_MOMENTUM
+    assert tracker.get_momentum(20.0, now_ms=7_000.0).start_price == 100.0
+
+    # Past retention, cleanup drops everything
+    short, long = tracker.get_all_momentum(now_ms=60_000.0)
+    assert short is EMPTY_MOMENTUM
+    assert long is EMPTY_MOMENTUM
+
+
+def test_is_usable_ignores_points_evicted_by_cap():
+    tracker = PriceMomentumTracker(
+        short_window_seconds=1.0,
+        long_window_seconds=2.0,
+        expected_updates_per_second=10.0,
+    )
+    # 200 points 10ms apart: all within retention, but past the 86 point cap
+    points = [(i * 10.0, 100.0 + i * 0.01) for i in range(200)]
+    feed(tracker, points)
+
+    assert tracker._head == 200 - tracker._max_points
+
+    short, long = tracker.get_all_momentum(now_ms=points[-1][0])
+    assert short.is_usable
+    # 850ms of live history is less than half the 2s window
+    assert not long.is_usable
+    assert long.start_price == points[tracker._head][1]
+
+
+def test_cleanup_is_skipped_within_interval():
+    tracker = PriceMomentumTracker()
+    feed(tracker, [(0.0, 100.0), (30.0, 100.0)])
+
+    # Cutoff lands on the first point, so nothing expires yet
+    tracker.get_momentum(5.0, now_ms=22_000.0)
+    assert tracker._head == 0
+
+    # Both points are past retention here, but cleanup ran 40ms ago
+    tracker.get_momentum(5.0, now_ms=22_040.0)
+    assert tracker._head == 0
+
+    assert tracker.get_momentum(20.0, now_ms=22_050.0) is EMPTY_MOMENTUM
+    assert tracker._head == 2
@@ -0,0 +1,62 @@
+"""Tests for backend.session_context."""
+
+import random
+
+import pytest
+
+from backend.session_context import SessionContextTracker
+
+HOUR_MS = 3600 * 1000
+
+
+def make_trades(count, step_ms, seed=3):
+    rng = random.Random(seed)
+    return [
+        (i * step_ms, 100.0 + rng.uniform(-5.0, 5.0), rng.choice([50.0, 250.0, 1000.0, 4000.0]))
+        for i in range(count)
+    ]
+
+
+def window_sums(trades, cutoff_ms):
+    live = [(price, size) for ts, price, size in trades if ts >= cutoff_ms]
+    return sum(price * size for price, size in live), sum(size for _, size in live)
+
+
+def test_vwap_and_volumes_survive_compaction():
+    tracker = SessionContextTracker(vwap_window_hours=5.0)
+    # 10s apart over 12h: thousands of trades expire, so the columns are
+    # compacted and the prefix sums rebased several times
+    trades = make_trades(4320, 10_000.0)
+    for trade in trades:
+        tracker.add_trade(*trade)
+
+    assert len(tracker._trade_ts) < len(trades)
+
+    now_ms = trades[-1][0]
+    ctx = tracker.get_context(now_ms)
+
+    notional, volume = window_sums(trades, now_ms - 5 * HOUR_MS)
+    assert ctx.session_vwap == pytest.approx(notional / volume)
+    assert ctx.session_volume_usd == pytest.approx(volume)
+    assert ctx.last_1h_volume_usd == pytest.approx(window_sums(trades, now_ms - HOUR_MS)[1])
+    assert ctx.last_4h_volume_usd == pytest.approx(window_sums(trades, now_ms - 4 * HOUR_MS)[1])
+
+
+def test_get_context_windows_follow_now_ms():
+    tracker = SessionContextTracker()
+    trades = make_trades(300, 60_000.0)  # 5h of trades, one a minute
+    for trade in trades:
+        tracker.add_trade(*trade)
+
+    now_ms = trades[-1][0] + 30 * 60 * 1000
+
+    first = tracker.get_context(now_ms)
+    assert tracker.get_context(now_ms) == first
+    assert first.session_duration_hours == pytest.approx(now_ms / HOUR_MS)
+    assert first.last_1h_volume_usd == pytest.approx(window_sums(trades, now_ms - HOUR_MS)[1])
+    assert first.last_4h_volume_usd == pytest.approx(window_sums(trades, now_ms - 4 * HOUR_MS)[1])
+
+    # Two hours on with no new trades, the 1h window is empty
+    later = tracker.get_context(now_ms + 2 * HOUR_MS)
+    assert later.last_1h_volume_usd == 0.0
+    assert later.session_volume_usd == first.session_volume_usd
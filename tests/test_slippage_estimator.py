@@ -0,0 +1,45 @@
+"""Tests for backend.slippage_estimator."""
+
+from backend.slippage_estimator import OrderBookLevel, SlippageEstimator
+
+
+def make_levels(prices):
+    return [OrderBookLevel(price=price, size=10.0, total_usd=price * 10.0) for price in prices]
+
+
+def estimate(estimator, bids, asks):
+    return estimator.estimate_for_sizes(
+        bids=bids,
+        asks=asks,
+        trade_sizes_usd=[500.0, 5000.0],
+        best_bid=bids[0].price,
+        best_ask=asks[0].price,
+        spread_bps=2.0,
+    )
+
+
+def test_in_place_book_change_is_recomputed():
+    estimator = SlippageEstimator()
+    bids = make_levels([99.0, 98.0, 97.0])
+    asks = make_levels([101.0, 102.0, 103.0])
+
+    before = estimate(estimator, bids, asks)
+    asks[1] = OrderBookLevel(price=110.0, size=10.0, total_usd=1100.0)
+    after = estimate(estimator, bids, asks)
+
+    assert after["$5k"]["buy"].avg_fill_price > before["$5k"]["buy"].avg_fill_price
+    assert after["$5k"]["sell"] == before["$5k"]["sell"]
+
+
+def test_caller_changes_do_not_leak_into_cached_results():
+    estimator = SlippageEstimator()
+    bids = make_levels([99.0, 98.0])
+    asks = make_levels([101.0, 102.0])
+
+    first = estimate(estimator, bids, asks)
+    first["$500"]["buy"] = None
+    del first["$5k"]
+    second = estimate(estimator, bids, asks)
+
+    assert second["$500"]["buy"] is not None
+    assert "$5k" in second